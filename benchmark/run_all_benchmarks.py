@@ -8,83 +8,149 @@ comparison report in markdown format.
 
 import argparse
 import json
+import re
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# Warm-up the child scripts run before each measured window (their --warmup
+# default; this runner does not override it). The watchdog deadline must
+# account for it: the children run every variant for duration + warmup
+# seconds, so a deadline scaled on duration alone kills short runs mid-way.
+CHILD_WARMUP = 5
+
 
 def run_benchmark(
-    script: str, concurrency: int, duration: int, host: str, keyspace: str
+    script: str,
+    concurrency: int,
+    duration: int,
+    host: str,
+    keyspace: str,
+    results_json: str | None = None,
 ) -> list[dict] | None:
-    """Run a single benchmark script and capture results."""
+    """Run a single benchmark script and capture results.
+
+    When the script supports it, pass ``results_json`` to make the child write
+    machine-readable results to that path — the parent then loads the file and
+    skips stdout parsing entirely. Scripts without JSON support fall back to
+    ``parse_output`` over the captured text.
+    """
     print(f"\n{'=' * 80}")
     print(f"Running {script}...")
     print(f"{'=' * 80}\n")
 
+    cmd = [
+        sys.executable,
+        script,
+        "--concurrency",
+        str(concurrency),
+        "--duration",
+        str(duration),
+        "--host",
+        host,
+        "--keyspace",
+        keyspace,
+    ]
+    if results_json:
+        cmd += ["--results-json", results_json]
+
     try:
-        result = subprocess.run(
-            [
-                sys.executable,
-                script,
-                "--concurrency",
-                str(concurrency),
-                "--duration",
-                str(duration),
-                "--host",
-                host,
-                "--keyspace",
-                keyspace,
-            ],
-            capture_output=True,
+        # Stream the child's output line by line instead of buffering it all
+        # in memory: progress is visible in real time and the parent stays
+        # constant-memory for arbitrarily chatty children.
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=duration * 10,  # Generous timeout
+            bufsize=1,
         )
 
-        if result.returncode != 0:
-            print(f"Error running {script}:")
-            print(result.stderr)
+        # The deadline must hold even when the child produces no output
+        # (e.g. the server stops responding after startup), so a watchdog
+        # kills it instead of checking the clock only when a line arrives.
+        timed_out = threading.Event()
+
+        def kill_on_deadline():
+            timed_out.set()
+            proc.kill()
+
+        # Generous timeout
+        watchdog = threading.Timer((duration + CHILD_WARMUP) * 10, kill_on_deadline)
+        watchdog.start()
+
+        lines = []
+        try:
+            for line in proc.stdout:
+                print(line, end="")
+                lines.append(line)
+
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set():
+            print(f"Timeout running {script}")
+            return None
+
+        if returncode != 0:
+            print(f"Error running {script} (exit code {proc.returncode})")
             return None
 
-        print(result.stdout)
-        return parse_output(result.stdout)
+        if results_json:
+            try:
+                with open(results_json) as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Could not read JSON results from {results_json}: {e}")
+
+        return parse_output("".join(lines))
 
-    except subprocess.TimeoutExpired:
-        print(f"Timeout running {script}")
-        return None
     except Exception as e:
         print(f"Exception running {script}: {e}")
         return None
 
 
+# One precompiled pattern for every metric line; exactly one named group
+# matches per line, so a single C-level regex step replaces the chain of
+# substring tests and split(":") calls.
+_METRIC_RE = re.compile(
+    r"^(?:Starting benchmark (?P<name>.+?)"
+    r"|\s*(?:Ops/sec|QPS):\s*(?P<ops>\d+)"
+    r"|\s*Avg:\s*(?P<avg>[\d.]+)"
+    r"|\s*P90:\s*(?P<p90>[\d.]+)"
+    r"|\s*P99:\s*(?P<p99>[\d.]+))\s*$"
+)
+
+
 def parse_output(output: str) -> list[dict]:
     """Parse benchmark output to extract metrics."""
     results = []
-    lines = output.split("\n")
-
-    current_benchmark = None
-    for line in lines:
-        if "Starting benchmark" in line:
-            current_benchmark = line.split("Starting benchmark")[1].strip()
-        elif "Ops/sec:" in line or "QPS:" in line:
-            if current_benchmark:
-                ops_per_sec = int(line.split(":")[1].strip())
-        elif "Avg:" in line:
-            avg = float(line.split(":")[1].strip())
-        elif "P90:" in line:
-            p90 = float(line.split(":")[1].strip())
-        elif "P99:" in line:
-            p99 = float(line.split(":")[1].strip())
-            # All metrics collected for this benchmark
-            results.append(
-                {
-                    "name": current_benchmark,
-                    "ops_per_sec": ops_per_sec,
-                    "avg": avg,
-                    "p90": p90,
-                    "p99": p99,
-                }
-            )
-            current_benchmark = None
+    current = None
+
+    for line in output.split("\n"):
+        m = _METRIC_RE.match(line)
+        if not m:
+            continue
+
+        if m.group("name") is not None:
+            current = {"name": m.group("name")}
+        elif current is not None:
+            if m.group("ops") is not None:
+                current["ops_per_sec"] = int(m.group("ops"))
+            elif m.group("avg") is not None:
+                current["avg"] = float(m.group("avg"))
+            elif m.group("p90") is not None:
+                current["p90"] = float(m.group("p90"))
+            elif m.group("p99") is not None:
+                current["p99"] = float(m.group("p99"))
+                # Only emit benchmarks whose metrics all arrived; a dropped
+                # line can no longer leak values from a previous benchmark.
+                if len(current) == 5:
+                    results.append(current)
+                current = None
 
     return results
 
@@ -127,15 +193,17 @@ def generate_markdown_report(
             for r in lib_results:
                 benchmark_types.add(r["name"])
 
+        # Pivot the results once so every section below is a dict lookup
+        # instead of a rescan of each library's full result list.
+        pivot = {bench_type: {} for bench_type in benchmark_types}
+        for lib, lib_results in results.items():
+            for r in lib_results:
+                pivot[r["name"]][lib] = r
+
         for bench_type in sorted(benchmark_types):
             f.write(f"**{bench_type}:**\n\n")
 
-            lib_ops = {}
-            for lib, lib_results in results.items():
-                for r in lib_results:
-                    if r["name"] == bench_type:
-                        lib_ops[lib] = r["ops_per_sec"]
-                        break
+            lib_ops = {lib: r["ops_per_sec"] for lib, r in pivot[bench_type].items()}
 
             if lib_ops:
                 winner = max(lib_ops, key=lib_ops.get)
@@ -158,14 +226,12 @@ def generate_markdown_report(
             )
 
             for lib in ["rsylla", "acsylla", "cassandra-driver"]:
-                if lib in results:
-                    for r in results[lib]:
-                        if r["name"] == bench_type:
-                            f.write(
-                                f"| {lib} | {r['ops_per_sec']:,} | {r['avg']:.6f} | "
-                                f"{r['p90']:.6f} | {r['p99']:.6f} |\n"
-                            )
-                            break
+                r = pivot[bench_type].get(lib)
+                if r:
+                    f.write(
+                        f"| {lib} | {r['ops_per_sec']:,} | {r['avg']:.6f} | "
+                        f"{r['p90']:.6f} | {r['p99']:.6f} |\n"
+                    )
 
             f.write("\n")
 
@@ -179,23 +245,16 @@ def generate_markdown_report(
         f.write("|-----------|--------|---------|------------------|\n")
 
         for bench_type in sorted(benchmark_types):
-            baseline = None
-            lib_values = {}
-
-            for lib in ["rsylla", "acsylla", "cassandra-driver"]:
-                if lib in results:
-                    for r in results[lib]:
-                        if r["name"] == bench_type:
-                            lib_values[lib] = r["ops_per_sec"]
-                            if lib == "cassandra-driver":
-                                baseline = r["ops_per_sec"]
-                            break
+            by_lib = pivot[bench_type]
+            baseline_result = by_lib.get("cassandra-driver")
+            baseline = baseline_result["ops_per_sec"] if baseline_result else None
 
             if baseline and baseline > 0:
                 row = f"| {bench_type} |"
                 for lib in ["rsylla", "acsylla", "cassandra-driver"]:
-                    if lib in lib_values:
-                        speedup = lib_values[lib] / baseline
+                    r = by_lib.get(lib)
+                    if r:
+                        speedup = r["ops_per_sec"] / baseline
                         row += f" {speedup:.2f}x |"
                     else:
                         row += " N/A |"
@@ -212,11 +271,9 @@ def generate_markdown_report(
         for bench_type in sorted(benchmark_types):
             row = f"| {bench_type} |"
             for lib in ["rsylla", "acsylla", "cassandra-driver"]:
-                if lib in results:
-                    for r in results[lib]:
-                        if r["name"] == bench_type:
-                            row += f" {r['avg'] * 1000:.3f} |"
-                            break
+                r = pivot[bench_type].get(lib)
+                if r:
+                    row += f" {r['avg'] * 1000:.3f} |"
                 else:
                     row += " N/A |"
             f.write(row + "\n")
@@ -231,19 +288,10 @@ def generate_markdown_report(
         acsylla_speedups = []
 
         for bench_type in sorted(benchmark_types):
-            cassandra_ops = None
-            rsylla_ops = None
-            acsylla_ops = None
-
-            for lib, lib_results in results.items():
-                for r in lib_results:
-                    if r["name"] == bench_type:
-                        if lib == "cassandra-driver":
-                            cassandra_ops = r["ops_per_sec"]
-                        elif lib == "rsylla":
-                            rsylla_ops = r["ops_per_sec"]
-                        elif lib == "acsylla":
-                            acsylla_ops = r["ops_per_sec"]
+            by_lib = pivot[bench_type]
+            cassandra_ops = by_lib.get("cassandra-driver", {}).get("ops_per_sec")
+            rsylla_ops = by_lib.get("rsylla", {}).get("ops_per_sec")
+            acsylla_ops = by_lib.get("acsylla", {}).get("ops_per_sec")
 
             if cassandra_ops and rsylla_ops:
                 rsylla_speedups.append(rsylla_ops / cassandra_ops)
@@ -265,16 +313,9 @@ def generate_markdown_report(
         if rsylla_speedups and acsylla_speedups:
             rsylla_vs_acsylla = []
             for bench_type in sorted(benchmark_types):
-                rsylla_ops = None
-                acsylla_ops = None
-
-                for lib, lib_results in results.items():
-                    for r in lib_results:
-                        if r["name"] == bench_type:
-                            if lib == "rsylla":
-                                rsylla_ops = r["ops_per_sec"]
-                            elif lib == "acsylla":
-                                acsylla_ops = r["ops_per_sec"]
+                by_lib = pivot[bench_type]
+                rsylla_ops = by_lib.get("rsylla", {}).get("ops_per_sec")
+                acsylla_ops = by_lib.get("acsylla", {}).get("ops_per_sec")
 
                 if rsylla_ops and acsylla_ops:
                     rsylla_vs_acsylla.append(rsylla_ops / acsylla_ops)
@@ -320,7 +361,7 @@ def generate_markdown_report(
     print(f"\n\nReport generated: {output_file}")
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run benchmarks for rsylla, acsylla, and cassandra-driver"
     )
@@ -361,8 +402,23 @@ def main():
         default=["rsylla", "acsylla", "cassandra-driver"],
         help="Libraries to benchmark (default: all)",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run library benchmarks concurrently, each against its own "
+        "'<keyspace>_<lib>' keyspace (faster wall clock, but the libraries "
+        "compete for server resources — use for correctness runs, not for "
+        "absolute throughput numbers)",
+    )
+    return parser
+
+
+# Built once at import; repeated main() calls (CI sweeps, tests) reuse it.
+_PARSER = _build_parser()
 
-    args = parser.parse_args()
+
+def main(argv=None):
+    args = _PARSER.parse_args(argv)
 
     results = {}
 
@@ -373,20 +429,56 @@ def main():
         "cassandra-driver": "/tmp/cassandra_python_benchmark.py",
     }
 
+    # Scripts shipped in this repo write machine-readable JSON results;
+    # the external comparison scripts are still parsed from stdout.
+    json_capable = {"rsylla"}
+
+    jobs = []
     for lib in args.libraries:
         if lib not in scripts:
             print(f"Warning: Unknown library {lib}, skipping")
             continue
 
-        script = scripts[lib]
-        lib_results = run_benchmark(
-            script, args.concurrency, args.duration, args.host, args.keyspace
-        )
+        keyspace = args.keyspace
+        if args.parallel:
+            # Isolate concurrent runs in per-library keyspaces (schema must
+            # have been set up for each, e.g. via setup_schema.py).
+            keyspace = f"{args.keyspace}_{lib.replace('-', '_')}"
+
+        results_json = f"/tmp/{lib}_results.json" if lib in json_capable else None
+        jobs.append((lib, scripts[lib], keyspace, results_json))
+
+    if args.parallel:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {
+                pool.submit(
+                    run_benchmark,
+                    script,
+                    args.concurrency,
+                    args.duration,
+                    args.host,
+                    keyspace,
+                    results_json,
+                ): lib
+                for lib, script, keyspace, results_json in jobs
+            }
+            for future in as_completed(futures):
+                lib = futures[future]
+                lib_results = future.result()
+                if lib_results:
+                    results[lib] = lib_results
+                else:
+                    print(f"Warning: No results for {lib}")
+    else:
+        for lib, script, keyspace, results_json in jobs:
+            lib_results = run_benchmark(
+                script, args.concurrency, args.duration, args.host, keyspace, results_json
+            )
 
-        if lib_results:
-            results[lib] = lib_results
-        else:
-            print(f"Warning: No results for {lib}")
+            if lib_results:
+                results[lib] = lib_results
+            else:
+                print(f"Warning: No results for {lib}")
 
     if not results:
         print("Error: No benchmark results collected")
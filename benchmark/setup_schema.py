@@ -48,10 +48,10 @@ async def setup_schema(host: str, keyspace: str, replication_factor: int = 1):
     # Insert some initial data to ensure the table is not empty
     print("Inserting initial test data...")
     try:
-        for i in range(100):
-            await session.execute(
-                "INSERT INTO test (id, value) VALUES (?, ?)", {"id": i, "value": i}
-            )
+        prepared = await session.prepare("INSERT INTO test (id, value) VALUES (?, ?)")
+        await asyncio.gather(
+            *(session.execute_prepared(prepared, {"id": i, "value": i}) for i in range(100))
+        )
         print("Initial data inserted successfully")
     except Exception as e:
         print(f"Error inserting initial data: {e}")
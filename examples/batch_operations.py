@@ -70,19 +70,24 @@ def main():
         )
         print("  Order 1 created")
 
-        # Create another batch for different order
-        batch2 = Batch("logged")
-        batch2.append_statement(
-            "INSERT INTO orders (order_id, user_id, product_id, quantity) VALUES (?, ?, ?, ?)"
-        )
-        batch2.append_statement(
+        # Create another batch for different order. This one spans two
+        # tables with different partition keys, so build it from prepared
+        # statements and let batch_partitioned split it into partition-local
+        # sub-batches shipped in parallel instead of stressing one
+        # coordinator with a cross-partition batch.
+        insert_order = session.prepare(
             "INSERT INTO orders (order_id, user_id, product_id, quantity) VALUES (?, ?, ?, ?)"
         )
-        batch2.append_statement(
+        insert_user_order = session.prepare(
             "INSERT INTO user_orders (user_id, order_id, total_items) VALUES (?, ?, ?)"
         )
 
-        session.batch(
+        batch2 = Batch("logged")
+        batch2.append_prepared(insert_order)
+        batch2.append_prepared(insert_order)
+        batch2.append_prepared(insert_user_order)
+
+        session.batch_partitioned(
             batch2,
             [
                 {"order_id": 2, "user_id": 100, "product_id": 1, "quantity": 1},
@@ -111,16 +116,18 @@ def main():
         )
         print("  Order 3 created (unlogged)")
 
-        # Query results
-        print("\nQuerying orders...")
-        result = session.execute("SELECT * FROM orders")
-        for row in result:
+        # Query both tables in one pipelined call - the independent SELECTs
+        # are in flight concurrently instead of paying two round-trips
+        print("\nQuerying orders and user orders...")
+        orders_result, user_orders_result = session.pipeline(
+            ["SELECT * FROM orders", "SELECT * FROM user_orders"]
+        )
+        for row in orders_result:
             cols = row.columns()
             print(f"  Order {cols[0]}: User {cols[1]}, Product {cols[2]}, Qty {cols[3]}")
 
-        print("\nQuerying user orders...")
-        result = session.execute("SELECT * FROM user_orders")
-        for row in result:
+        print("\nUser orders:")
+        for row in user_orders_result:
             cols = row.columns()
             print(f"  User {cols[0]}: Order {cols[1]}, Total items {cols[2]}")
 
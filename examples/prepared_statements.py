@@ -55,8 +55,8 @@ def main():
             {"id": 3, "name": "Keyboard", "price": 79.99, "quantity": 30},
         ]
 
+        session.execute_concurrent(insert_prepared, products)
         for product in products:
-            session.execute_prepared(insert_prepared, product)
             print(f"  Inserted: {product['name']}")
 
         # Query using prepared statement
@@ -11,6 +11,7 @@ from ._rsylla import (
     Query,
     QueryResult,
     Row,
+    RowStream,
     ScyllaError,
     Session,
     SessionBuilder,
@@ -25,6 +26,7 @@ __all__ = [
     "PreparedStatement",
     "QueryResult",
     "Row",
+    "RowStream",
     "Batch",
     "ScyllaError",
 ]
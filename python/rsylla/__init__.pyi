@@ -17,6 +17,7 @@ class SessionBuilder:
     def use_keyspace(self, keyspace_name: str, case_sensitive: bool) -> SessionBuilder: ...
     def connection_timeout(self, duration_ms: int) -> SessionBuilder: ...
     def pool_size(self, size: int) -> SessionBuilder: ...
+    def connections_per_shard(self, count: int) -> SessionBuilder: ...
     def user(self, username: str, password: str) -> SessionBuilder: ...
     def compression(self, compression: str | None) -> SessionBuilder: ...
     def tcp_nodelay(self, nodelay: bool) -> SessionBuilder: ...
@@ -28,15 +29,55 @@ class Session:
 
     @staticmethod
     def connect(nodes: list[str]) -> Session: ...
-    def execute(self, query: str, values: dict[str, Any] | None = None) -> QueryResult: ...
-    def query(self, query: Query, values: dict[str, Any] | None = None) -> QueryResult: ...
+    def execute(
+        self,
+        query: str,
+        values: dict[str, Any] | list[Any] | tuple[Any, ...] | None = None,
+    ) -> QueryResult: ...
+    def query(
+        self,
+        query: Query,
+        values: dict[str, Any] | list[Any] | tuple[Any, ...] | None = None,
+    ) -> QueryResult: ...
     def prepare(self, query: str) -> PreparedStatement: ...
     def execute_prepared(
-        self, prepared: PreparedStatement, values: dict[str, Any] | None = None
+        self,
+        prepared: PreparedStatement,
+        values: dict[str, Any] | list[Any] | tuple[Any, ...] | None = None,
     ) -> QueryResult: ...
     def batch(self, batch: Batch, values: list[dict[str, Any]]) -> QueryResult: ...
+    def batch_partitioned(self, batch: Batch, values: list[dict[str, Any]]) -> int: ...
+    def execute_batch(
+        self,
+        prepared: PreparedStatement,
+        values: list[dict[str, Any] | list[Any] | tuple[Any, ...]],
+        batch_type: str = "unlogged",
+    ) -> QueryResult: ...
+    def execute_many(
+        self,
+        prepared: PreparedStatement,
+        values: list[dict[str, Any] | list[Any] | tuple[Any, ...]],
+    ) -> list[QueryResult]: ...
+    def execute_concurrent(
+        self,
+        prepared: PreparedStatement,
+        values: list[dict[str, Any] | list[Any] | tuple[Any, ...]],
+        concurrency: int = 100,
+    ) -> int: ...
+    def execute_concurrent_results(
+        self,
+        prepared: PreparedStatement,
+        values: list[dict[str, Any] | list[Any] | tuple[Any, ...]],
+        concurrency: int = 100,
+    ) -> list[QueryResult]: ...
+    def pipeline(self, queries: list[str]) -> list[QueryResult]: ...
+    def stream(
+        self,
+        query: str,
+        values: dict[str, Any] | list[Any] | tuple[Any, ...] | None = None,
+    ) -> RowStream: ...
     def use_keyspace(self, keyspace_name: str, case_sensitive: bool) -> None: ...
-    def await_schema_agreement(self) -> bool: ...
+    def await_schema_agreement(self, force: bool = False) -> bool: ...
     def get_cluster_data(self) -> str: ...
     def get_keyspace(self) -> str | None: ...
 
@@ -64,6 +105,8 @@ class PreparedStatement:
     def with_tracing(self, tracing: bool) -> PreparedStatement: ...
     def is_idempotent(self) -> bool: ...
     def set_idempotent(self, idempotent: bool) -> PreparedStatement: ...
+    def set_use_cached_metadata(self, enabled: bool) -> PreparedStatement: ...
+    def partition_key_indexes(self) -> list[int]: ...
     def get_id(self) -> bytes: ...
     def get_statement(self) -> str: ...
 
@@ -75,6 +118,7 @@ class QueryResult:
     def single_row(self) -> Row: ...
     def first_row_typed(self) -> dict[str, Any] | None: ...
     def rows_typed(self) -> list[dict[str, Any]]: ...
+    def columns_numpy(self) -> dict[str, Any]: ...
     def col_specs(self) -> list[dict[str, Any]]: ...
     def tracing_id(self) -> str | None: ...
     def warnings(self) -> list[str]: ...
@@ -83,12 +127,22 @@ class QueryResult:
     def __len__(self) -> int: ...
     def __bool__(self) -> bool: ...
 
+class RowStream:
+    """Async iterator over a paged query result"""
+
+    def __aiter__(self) -> RowStream: ...
+    def __anext__(self) -> Row: ...
+
 class Row:
     """A row from a query result"""
 
-    def columns(self) -> list[Any]: ...
+    def columns(self) -> tuple[Any, ...]: ...
     def as_dict(self) -> dict[str, Any]: ...
     def get(self, index: int) -> Any: ...
+    def get_str(self, index: int) -> str: ...
+    def get_int(self, index: int) -> int: ...
+    def get_float(self, index: int) -> float: ...
+    def get_bool(self, index: int) -> bool: ...
     def __len__(self) -> int: ...
     def __getitem__(self, index: int) -> Any: ...
     def __repr__(self) -> str: ...
@@ -8,6 +8,10 @@ use crate::query::{PreparedStatement, Query};
 #[derive(Clone)]
 pub struct Batch {
     pub(crate) inner: ScyllaBatch,
+    /// Mirrors of inner state kept on the wrapper so the hot accessors
+    /// below answer from a plain field without touching the driver struct.
+    statements_count: usize,
+    idempotent: bool,
 }
 
 #[pymethods]
@@ -28,19 +32,24 @@ impl Batch {
 
         Ok(Batch {
             inner: ScyllaBatch::new(btype),
+            statements_count: 0,
+            idempotent: false,
         })
     }
 
     pub fn append_statement(&mut self, query: &str) {
         self.inner.append_statement(query);
+        self.statements_count += 1;
     }
 
     pub fn append_query(&mut self, query: &Query) {
         self.inner.append_statement(query.inner.clone());
+        self.statements_count += 1;
     }
 
     pub fn append_prepared(&mut self, prepared: &PreparedStatement) {
         self.inner.append_statement((*prepared.prepared).clone());
+        self.statements_count += 1;
     }
 
     pub fn with_consistency(&mut self, consistency: &str) -> PyResult<Self> {
@@ -72,33 +81,37 @@ impl Batch {
     }
 
     pub fn is_idempotent(&self) -> bool {
-        self.inner.get_is_idempotent()
+        self.idempotent
     }
 
     pub fn set_idempotent(&mut self, idempotent: bool) {
         self.inner.set_is_idempotent(idempotent);
+        self.idempotent = idempotent;
     }
 
     pub fn statements_count(&self) -> usize {
-        self.inner.statements.len()
+        self.statements_count
     }
 
     pub fn __repr__(&self) -> String {
-        format!("Batch(statements={})", self.inner.statements.len())
+        format!("Batch(statements={})", self.statements_count)
     }
 }
 
 fn parse_consistency(consistency: &str) -> PyResult<Consistency> {
-    match consistency.to_uppercase().as_str() {
-        "ANY" => Ok(Consistency::Any),
-        "ONE" => Ok(Consistency::One),
-        "TWO" => Ok(Consistency::Two),
-        "THREE" => Ok(Consistency::Three),
-        "QUORUM" => Ok(Consistency::Quorum),
-        "ALL" => Ok(Consistency::All),
-        "LOCAL_QUORUM" | "LOCALQUORUM" => Ok(Consistency::LocalQuorum),
-        "EACH_QUORUM" | "EACHQUORUM" => Ok(Consistency::EachQuorum),
-        "LOCAL_ONE" | "LOCALONE" => Ok(Consistency::LocalOne),
+    // Valid level names are ASCII and at most 12 bytes, so mixed-case input
+    // is uppercased into a stack buffer instead of a heap String per call.
+    let mut buf = [0u8; 16];
+    match ascii_uppercase(consistency, &mut buf) {
+        Some("ANY") => Ok(Consistency::Any),
+        Some("ONE") => Ok(Consistency::One),
+        Some("TWO") => Ok(Consistency::Two),
+        Some("THREE") => Ok(Consistency::Three),
+        Some("QUORUM") => Ok(Consistency::Quorum),
+        Some("ALL") => Ok(Consistency::All),
+        Some("LOCAL_QUORUM" | "LOCALQUORUM") => Ok(Consistency::LocalQuorum),
+        Some("EACH_QUORUM" | "EACHQUORUM") => Ok(Consistency::EachQuorum),
+        Some("LOCAL_ONE" | "LOCALONE") => Ok(Consistency::LocalOne),
         _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
             "Invalid consistency level: {}",
             consistency
@@ -107,12 +120,29 @@ fn parse_consistency(consistency: &str) -> PyResult<Consistency> {
 }
 
 fn parse_serial_consistency(consistency: &str) -> PyResult<scylla::statement::SerialConsistency> {
-    match consistency.to_uppercase().as_str() {
-        "SERIAL" => Ok(scylla::statement::SerialConsistency::Serial),
-        "LOCAL_SERIAL" | "LOCALSERIAL" => Ok(scylla::statement::SerialConsistency::LocalSerial),
+    let mut buf = [0u8; 16];
+    match ascii_uppercase(consistency, &mut buf) {
+        Some("SERIAL") => Ok(scylla::statement::SerialConsistency::Serial),
+        Some("LOCAL_SERIAL" | "LOCALSERIAL") => {
+            Ok(scylla::statement::SerialConsistency::LocalSerial)
+        }
         _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
             "Invalid serial consistency level: {}",
             consistency
         ))),
     }
 }
+
+/// ASCII-uppercase `s` into `buf` without allocating. Returns None when the
+/// input is longer than the buffer, in which case it cannot be a valid
+/// level name anyway.
+fn ascii_uppercase<'a>(s: &str, buf: &'a mut [u8; 16]) -> Option<&'a str> {
+    let bytes = s.as_bytes();
+    if bytes.len() > buf.len() {
+        return None;
+    }
+    for (dst, src) in buf.iter_mut().zip(bytes) {
+        *dst = src.to_ascii_uppercase();
+    }
+    std::str::from_utf8(&buf[..bytes.len()]).ok()
+}
@@ -25,6 +25,10 @@ pub fn schema_agreement_error_to_py(err: scylla::errors::SchemaAgreementError) -
     PyErr::new::<ScyllaError, _>(format!("Schema agreement error: {}", err))
 }
 
+pub fn pager_error_to_py(err: scylla::errors::PagerExecutionError) -> PyErr {
+    PyErr::new::<ScyllaError, _>(format!("Query error: {}", err))
+}
+
 #[allow(dead_code)]
 pub fn serialization_error_to_py(err: scylla::serialize::SerializationError) -> PyErr {
     PyErr::new::<ScyllaError, _>(format!("Serialization error: {}", err))
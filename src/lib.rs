@@ -3,6 +3,12 @@
 
 use pyo3::prelude::*;
 
+// Row decoding is allocation-heavy (one dict per row, one string per text
+// cell); mimalloc's thread-local size classes make those small allocations
+// much cheaper than glibc malloc under concurrency.
+#[global_allocator]
+static GLOBAL: mimalloc::MiMalloc = mimalloc::MiMalloc;
+
 mod batch;
 mod error;
 mod query;
@@ -13,7 +19,7 @@ mod types;
 use batch::Batch;
 use error::ScyllaError;
 use query::{PreparedStatement, Query};
-use result::{QueryResult, Row};
+use result::{QueryResult, Row, RowStream};
 use session::{Session, SessionBuilder};
 
 #[pymodule]
@@ -25,6 +31,7 @@ fn _rsylla(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PreparedStatement>()?;
     m.add_class::<QueryResult>()?;
     m.add_class::<Row>()?;
+    m.add_class::<RowStream>()?;
     m.add_class::<Batch>()?;
 
     // Exception
@@ -22,37 +22,47 @@ impl Query {
         }
     }
 
-    pub fn with_consistency(&mut self, consistency: &str) -> PyResult<Self> {
+    // The with_* builders mutate in place and hand the same Python object
+    // back for chaining; the old return-a-clone style copied the statement
+    // (CQL text included) on every step while mutating the receiver anyway.
+
+    pub fn with_consistency<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        consistency: &str,
+    ) -> PyResult<PyRefMut<'py, Self>> {
         let cons = parse_consistency(consistency)?;
-        self.inner.set_consistency(cons);
-        Ok(self.clone())
+        slf.inner.set_consistency(cons);
+        Ok(slf)
     }
 
-    pub fn with_serial_consistency(&mut self, serial_consistency: &str) -> PyResult<Self> {
+    pub fn with_serial_consistency<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        serial_consistency: &str,
+    ) -> PyResult<PyRefMut<'py, Self>> {
         let cons = parse_serial_consistency(serial_consistency)?;
-        self.inner.set_serial_consistency(Some(cons));
-        Ok(self.clone())
+        slf.inner.set_serial_consistency(Some(cons));
+        Ok(slf)
     }
 
-    pub fn with_page_size(&mut self, page_size: i32) -> PyResult<Self> {
-        self.inner.set_page_size(page_size);
-        Ok(self.clone())
+    pub fn with_page_size(mut slf: PyRefMut<'_, Self>, page_size: i32) -> PyRefMut<'_, Self> {
+        slf.inner.set_page_size(page_size);
+        slf
     }
 
-    pub fn with_timestamp(&mut self, timestamp: i64) -> PyResult<Self> {
-        self.inner.set_timestamp(Some(timestamp));
-        Ok(self.clone())
+    pub fn with_timestamp(mut slf: PyRefMut<'_, Self>, timestamp: i64) -> PyRefMut<'_, Self> {
+        slf.inner.set_timestamp(Some(timestamp));
+        slf
     }
 
-    pub fn with_timeout(&mut self, timeout_ms: u64) -> PyResult<Self> {
-        self.inner
+    pub fn with_timeout(mut slf: PyRefMut<'_, Self>, timeout_ms: u64) -> PyRefMut<'_, Self> {
+        slf.inner
             .set_request_timeout(Some(Duration::from_millis(timeout_ms)));
-        Ok(self.clone())
+        slf
     }
 
-    pub fn with_tracing(&mut self, tracing: bool) -> PyResult<Self> {
-        self.inner.set_tracing(tracing);
-        Ok(self.clone())
+    pub fn with_tracing(mut slf: PyRefMut<'_, Self>, tracing: bool) -> PyRefMut<'_, Self> {
+        slf.inner.set_tracing(tracing);
+        slf
     }
 
     pub fn is_idempotent(&self) -> bool {
@@ -68,10 +78,41 @@ impl Query {
     }
 }
 
+/// Result-set column metadata converted to Python once at prepare time.
+/// The server fixes this metadata when the statement is prepared, so every
+/// QueryResult the statement produces can share these objects by refcount
+/// bump instead of rebuilding N spec dicts and name strings per query.
+pub struct ResultMetadata {
+    pub(crate) names: Arc<Vec<Py<pyo3::types::PyString>>>,
+    pub(crate) specs: Py<pyo3::types::PyList>,
+}
+
 #[pyclass]
 #[derive(Clone)]
 pub struct PreparedStatement {
     pub(crate) prepared: Arc<ScyllaPreparedStatement>,
+    /// Bind-parameter names in statement order as interned PyStrings,
+    /// captured once from the prepared metadata so dict values can be bound
+    /// positionally without re-hashing the key strings on every call.
+    pub(crate) param_keys: Arc<Vec<Py<pyo3::types::PyString>>>,
+    /// Converter per bind parameter, picked once from the prepared metadata
+    /// so each value skips the generic type-dispatch chain.
+    pub(crate) param_kinds: Arc<Vec<crate::types::ColumnKind>>,
+    pub(crate) result_metadata: Arc<ResultMetadata>,
+}
+
+impl PreparedStatement {
+    /// Clone-on-write helper: statement settings live on the per-handle
+    /// driver statement, while the metadata captured at prepare time is
+    /// shared by refcount.
+    fn rebind(&self, new_prepared: ScyllaPreparedStatement) -> Self {
+        PreparedStatement {
+            prepared: Arc::new(new_prepared),
+            param_keys: self.param_keys.clone(),
+            param_kinds: self.param_kinds.clone(),
+            result_metadata: self.result_metadata.clone(),
+        }
+    }
 }
 
 #[pymethods]
@@ -80,42 +121,32 @@ impl PreparedStatement {
         let cons = parse_consistency(consistency)?;
         let mut new_prepared = (*self.prepared).clone();
         new_prepared.set_consistency(cons);
-        Ok(PreparedStatement {
-            prepared: Arc::new(new_prepared),
-        })
+        Ok(self.rebind(new_prepared))
     }
 
     pub fn with_serial_consistency(&self, serial_consistency: &str) -> PyResult<Self> {
         let cons = parse_serial_consistency(serial_consistency)?;
         let mut new_prepared = (*self.prepared).clone();
         new_prepared.set_serial_consistency(Some(cons));
-        Ok(PreparedStatement {
-            prepared: Arc::new(new_prepared),
-        })
+        Ok(self.rebind(new_prepared))
     }
 
     pub fn with_page_size(&self, page_size: i32) -> PyResult<Self> {
         let mut new_prepared = (*self.prepared).clone();
         new_prepared.set_page_size(page_size);
-        Ok(PreparedStatement {
-            prepared: Arc::new(new_prepared),
-        })
+        Ok(self.rebind(new_prepared))
     }
 
     pub fn with_timestamp(&self, timestamp: i64) -> PyResult<Self> {
         let mut new_prepared = (*self.prepared).clone();
         new_prepared.set_timestamp(Some(timestamp));
-        Ok(PreparedStatement {
-            prepared: Arc::new(new_prepared),
-        })
+        Ok(self.rebind(new_prepared))
     }
 
     pub fn with_tracing(&self, tracing: bool) -> PyResult<Self> {
         let mut new_prepared = (*self.prepared).clone();
         new_prepared.set_tracing(tracing);
-        Ok(PreparedStatement {
-            prepared: Arc::new(new_prepared),
-        })
+        Ok(self.rebind(new_prepared))
     }
 
     pub fn is_idempotent(&self) -> bool {
@@ -125,9 +156,22 @@ impl PreparedStatement {
     pub fn set_idempotent(&self, idempotent: bool) -> Self {
         let mut new_prepared = (*self.prepared).clone();
         new_prepared.set_is_idempotent(idempotent);
-        PreparedStatement {
-            prepared: Arc::new(new_prepared),
-        }
+        self.rebind(new_prepared)
+    }
+
+    pub fn set_use_cached_metadata(&self, enabled: bool) -> Self {
+        let mut new_prepared = (*self.prepared).clone();
+        new_prepared.set_use_cached_result_metadata(enabled);
+        self.rebind(new_prepared)
+    }
+
+    /// Positions of the partition-key columns within the bind parameters,
+    /// in partition-key order. Populated by the server at prepare time; the
+    /// driver uses it for token-aware routing straight to a replica.
+    pub fn partition_key_indexes(&self) -> Vec<usize> {
+        let mut indexes = self.prepared.get_variable_pk_indexes().to_vec();
+        indexes.sort_by_key(|pk| pk.sequence);
+        indexes.iter().map(|pk| pk.index as usize).collect()
     }
 
     pub fn get_id<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
@@ -140,16 +184,19 @@ impl PreparedStatement {
 }
 
 fn parse_consistency(consistency: &str) -> PyResult<scylla::statement::Consistency> {
-    match consistency.to_uppercase().as_str() {
-        "ANY" => Ok(scylla::statement::Consistency::Any),
-        "ONE" => Ok(scylla::statement::Consistency::One),
-        "TWO" => Ok(scylla::statement::Consistency::Two),
-        "THREE" => Ok(scylla::statement::Consistency::Three),
-        "QUORUM" => Ok(scylla::statement::Consistency::Quorum),
-        "ALL" => Ok(scylla::statement::Consistency::All),
-        "LOCAL_QUORUM" | "LOCALQUORUM" => Ok(scylla::statement::Consistency::LocalQuorum),
-        "EACH_QUORUM" | "EACHQUORUM" => Ok(scylla::statement::Consistency::EachQuorum),
-        "LOCAL_ONE" | "LOCALONE" => Ok(scylla::statement::Consistency::LocalOne),
+    // Valid level names are ASCII and at most 12 bytes, so mixed-case input
+    // is uppercased into a stack buffer instead of a heap String per call.
+    let mut buf = [0u8; 16];
+    match ascii_uppercase(consistency, &mut buf) {
+        Some("ANY") => Ok(scylla::statement::Consistency::Any),
+        Some("ONE") => Ok(scylla::statement::Consistency::One),
+        Some("TWO") => Ok(scylla::statement::Consistency::Two),
+        Some("THREE") => Ok(scylla::statement::Consistency::Three),
+        Some("QUORUM") => Ok(scylla::statement::Consistency::Quorum),
+        Some("ALL") => Ok(scylla::statement::Consistency::All),
+        Some("LOCAL_QUORUM" | "LOCALQUORUM") => Ok(scylla::statement::Consistency::LocalQuorum),
+        Some("EACH_QUORUM" | "EACHQUORUM") => Ok(scylla::statement::Consistency::EachQuorum),
+        Some("LOCAL_ONE" | "LOCALONE") => Ok(scylla::statement::Consistency::LocalOne),
         _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
             "Invalid consistency level: {}",
             consistency
@@ -158,12 +205,29 @@ fn parse_consistency(consistency: &str) -> PyResult<scylla::statement::Consisten
 }
 
 fn parse_serial_consistency(consistency: &str) -> PyResult<scylla::statement::SerialConsistency> {
-    match consistency.to_uppercase().as_str() {
-        "SERIAL" => Ok(scylla::statement::SerialConsistency::Serial),
-        "LOCAL_SERIAL" | "LOCALSERIAL" => Ok(scylla::statement::SerialConsistency::LocalSerial),
+    let mut buf = [0u8; 16];
+    match ascii_uppercase(consistency, &mut buf) {
+        Some("SERIAL") => Ok(scylla::statement::SerialConsistency::Serial),
+        Some("LOCAL_SERIAL" | "LOCALSERIAL") => {
+            Ok(scylla::statement::SerialConsistency::LocalSerial)
+        }
         _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
             "Invalid serial consistency level: {}",
             consistency
         ))),
     }
 }
+
+/// ASCII-uppercase `s` into `buf` without allocating. Returns None when the
+/// input is longer than the buffer, in which case it cannot be a valid
+/// level name anyway.
+fn ascii_uppercase<'a>(s: &str, buf: &'a mut [u8; 16]) -> Option<&'a str> {
+    let bytes = s.as_bytes();
+    if bytes.len() > buf.len() {
+        return None;
+    }
+    for (dst, src) in buf.iter_mut().zip(bytes) {
+        *dst = src.to_ascii_uppercase();
+    }
+    std::str::from_utf8(&buf[..bytes.len()]).ok()
+}
@@ -1,82 +1,134 @@
+use futures::StreamExt;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyDict, PyList, PyString, PyTuple};
+use pyo3_async_runtimes::tokio::future_into_py;
+use scylla::client::pager::{QueryPager, TypedRowStream};
 use scylla::response::query_result::{QueryResult as ScyllaQueryResult, QueryRowsResult};
 use scylla::value::{CqlValue, Row as ScyllaRow};
+use std::sync::Arc;
 
+use crate::query::ResultMetadata;
 use crate::types::cql_value_to_py;
 
+fn deserialization_error<E: std::fmt::Display>(e: E) -> PyErr {
+    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Row deserialization error: {}", e))
+}
+
 #[pyclass]
 pub struct QueryResult {
     // Store the rows result if available
     rows_result: Option<QueryRowsResult>,
+    // Rows deserialized lazily, at most once, on first access that needs
+    // them all; iteration then indexes into this cache.
+    cached_rows: Option<Vec<ScyllaRow>>,
+    // Column names as interned PyStrings, built once on first typed access
+    // and shared with every Row handed out, so dict keys are reference-count
+    // bumps instead of fresh string allocations per row.
+    column_names: Option<Arc<Vec<Py<PyString>>>>,
     tracing_id: Option<String>,
     warnings: Vec<String>,
+    // Row count captured at construction; __len__/__bool__ answer from it
+    // without touching the rows payload.
+    row_count: usize,
+    // Metadata converted once at prepare time, shared with the statement
+    // that produced this result; None for unprepared queries, which fall
+    // back to per-result decoding.
+    prepared_metadata: Option<Arc<ResultMetadata>>,
     current_row: usize,
 }
 
 impl QueryResult {
     pub fn new(result: ScyllaQueryResult) -> Self {
+        Self::build(result, None)
+    }
+
+    /// Result of a prepared statement: column names and specs come from the
+    /// metadata captured at prepare time instead of being rebuilt here.
+    pub fn new_prepared(result: ScyllaQueryResult, metadata: Arc<ResultMetadata>) -> Self {
+        Self::build(result, Some(metadata))
+    }
+
+    fn build(result: ScyllaQueryResult, prepared_metadata: Option<Arc<ResultMetadata>>) -> Self {
         let tracing_id = result.tracing_id().map(|id| id.to_string());
         let warnings: Vec<String> = result.warnings().map(|s| s.to_string()).collect();
         let rows_result = result.into_rows_result().ok();
+        let row_count = rows_result
+            .as_ref()
+            .map_or(0, |rows_result| rows_result.rows_num());
 
         QueryResult {
             rows_result,
+            cached_rows: None,
+            column_names: None,
             tracing_id,
             warnings,
+            row_count,
+            prepared_metadata,
             current_row: 0,
         }
     }
+
+    fn ensure_rows(&mut self, py: Python<'_>) -> PyResult<&[ScyllaRow]> {
+        if self.cached_rows.is_none() {
+            // Decoding bytes into CqlValues needs no Python objects, so
+            // release the GIL for the whole page; only the later
+            // CqlValue-to-PyObject step reacquires it.
+            let rows_result = &self.rows_result;
+            let rows = py.detach(|| match rows_result {
+                Some(rows_result) => rows_result
+                    .rows()
+                    .map_err(deserialization_error)?
+                    .collect::<Result<Vec<_>, _>>()
+                    .map_err(deserialization_error),
+                None => Ok(Vec::new()),
+            })?;
+            self.cached_rows = Some(rows);
+        }
+        Ok(self.cached_rows.as_deref().unwrap())
+    }
+
+    fn column_names(&mut self, py: Python<'_>) -> Arc<Vec<Py<PyString>>> {
+        if self.column_names.is_none() {
+            if let Some(metadata) = &self.prepared_metadata {
+                self.column_names = Some(metadata.names.clone());
+                return metadata.names.clone();
+            }
+            let names = match &self.rows_result {
+                Some(rows_result) => rows_result
+                    .column_specs()
+                    .iter()
+                    .map(|spec| PyString::intern(py, spec.name()).unbind())
+                    .collect(),
+                None => Vec::new(),
+            };
+            self.column_names = Some(Arc::new(names));
+        }
+        self.column_names.as_ref().unwrap().clone()
+    }
 }
 
 #[pymethods]
 impl QueryResult {
-    pub fn rows(&self, py: Python) -> PyResult<Py<PyAny>> {
+    pub fn rows(&mut self, py: Python) -> PyResult<Py<PyAny>> {
+        let names = self.column_names(py);
         let py_list = PyList::empty(py);
 
-        if let Some(ref rows_result) = self.rows_result {
-            let rows: Vec<ScyllaRow> = rows_result
-                .rows()
-                .map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?
-                .collect::<Result<Vec<_>, _>>()
-                .map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?;
-
-            for row in rows {
-                let py_row = Py::new(py, Row::new(&row))?;
-                py_list.append(py_row)?;
-            }
+        for row in self.ensure_rows(py)? {
+            let py_row = Py::new(py, Row::new(row, names.clone()))?;
+            py_list.append(py_row)?;
         }
 
         Ok(py_list.into())
     }
 
-    pub fn first_row(&self) -> PyResult<Option<Row>> {
+    pub fn first_row(&mut self, py: Python) -> PyResult<Option<Row>> {
+        let names = self.column_names(py);
         if let Some(ref rows_result) = self.rows_result {
-            let mut rows_iter = rows_result.rows().map_err(|e| {
-                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                    "Row deserialization error: {}",
-                    e
-                ))
-            })?;
+            let mut rows_iter = rows_result.rows().map_err(deserialization_error)?;
 
             if let Some(row_result) = rows_iter.next() {
-                let row: ScyllaRow = row_result.map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?;
-                Ok(Some(Row::new(&row)))
+                let row: ScyllaRow = row_result.map_err(deserialization_error)?;
+                Ok(Some(Row::new(&row, names)))
             } else {
                 Ok(None)
             }
@@ -85,60 +137,32 @@ impl QueryResult {
         }
     }
 
-    pub fn single_row(&self) -> PyResult<Row> {
-        if let Some(ref rows_result) = self.rows_result {
-            let rows: Vec<ScyllaRow> = rows_result
-                .rows()
-                .map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?
-                .collect::<Result<Vec<_>, _>>()
-                .map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?;
-
-            if rows.len() == 1 {
-                Ok(Row::new(&rows[0]))
-            } else if rows.is_empty() {
-                Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    "No rows returned",
-                ))
-            } else {
-                Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
-                    "Expected single row, got {} rows",
-                    rows.len()
-                )))
-            }
-        } else {
+    pub fn single_row(&mut self, py: Python) -> PyResult<Row> {
+        let names = self.column_names(py);
+        let rows = self.ensure_rows(py)?;
+
+        if rows.len() == 1 {
+            Ok(Row::new(&rows[0], names))
+        } else if rows.is_empty() {
             Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 "No rows returned",
             ))
+        } else {
+            Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "Expected single row, got {} rows",
+                rows.len()
+            )))
         }
     }
 
-    pub fn first_row_typed(&self, py: Python) -> PyResult<Option<Py<PyAny>>> {
+    pub fn first_row_typed(&mut self, py: Python) -> PyResult<Option<Py<PyAny>>> {
+        let names = self.column_names(py);
         if let Some(ref rows_result) = self.rows_result {
-            let mut rows_iter = rows_result.rows().map_err(|e| {
-                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                    "Row deserialization error: {}",
-                    e
-                ))
-            })?;
+            let mut rows_iter = rows_result.rows().map_err(deserialization_error)?;
 
             if let Some(row_result) = rows_iter.next() {
-                let row: ScyllaRow = row_result.map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?;
-                let py_row = Row::new(&row);
+                let row: ScyllaRow = row_result.map_err(deserialization_error)?;
+                let py_row = Row::new(&row, names);
                 Ok(Some(py_row.as_dict(py)?))
             } else {
                 Ok(None)
@@ -148,36 +172,75 @@ impl QueryResult {
         }
     }
 
-    pub fn rows_typed(&self, py: Python) -> PyResult<Vec<Py<PyAny>>> {
-        let mut result = Vec::new();
+    pub fn rows_typed(&mut self, py: Python) -> PyResult<Vec<Py<PyAny>>> {
+        let names = self.column_names(py);
+        let rows = self.ensure_rows(py)?;
+        let mut result = Vec::with_capacity(rows.len());
 
-        if let Some(ref rows_result) = self.rows_result {
-            let rows: Vec<ScyllaRow> = rows_result
-                .rows()
-                .map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?
-                .collect::<Result<Vec<_>, _>>()
-                .map_err(|e| {
-                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                        "Row deserialization error: {}",
-                        e
-                    ))
-                })?;
-
-            for row in rows {
-                let py_row = Row::new(&row);
-                result.push(py_row.as_dict(py)?);
-            }
+        for row in rows {
+            let py_row = Row::new(row, names.clone());
+            result.push(py_row.as_dict(py)?);
         }
 
         Ok(result)
     }
 
+    /// Decode the result column-wise instead of row-wise: integer columns
+    /// come back as i64 ndarrays and float columns as f64 ndarrays, filled
+    /// in one pass with no per-cell Python object. Columns of other types,
+    /// or containing nulls, fall back to a plain list of converted values.
+    /// Returns a dict keyed by column name.
+    pub fn columns_numpy(&mut self, py: Python) -> PyResult<Py<PyAny>> {
+        use numpy::PyArray1;
+
+        let names = self.column_names(py);
+        let rows = self.ensure_rows(py)?;
+        let dict = PyDict::new(py);
+
+        for (col, name) in names.iter().enumerate() {
+            let cells: Vec<Option<&CqlValue>> = rows
+                .iter()
+                .map(|row| row.columns.get(col).and_then(|c| c.as_ref()))
+                .collect();
+
+            if let Some(ints) = cells
+                .iter()
+                .map(|cell| cell.and_then(cql_to_i64))
+                .collect::<Option<Vec<i64>>>()
+            {
+                dict.set_item(name.bind(py), PyArray1::from_vec(py, ints))?;
+                continue;
+            }
+
+            if let Some(floats) = cells
+                .iter()
+                .map(|cell| cell.and_then(cql_to_f64))
+                .collect::<Option<Vec<f64>>>()
+            {
+                dict.set_item(name.bind(py), PyArray1::from_vec(py, floats))?;
+                continue;
+            }
+
+            let values = cells
+                .iter()
+                .map(|cell| match cell {
+                    Some(value) => cql_value_to_py(py, value),
+                    None => Ok(py.None()),
+                })
+                .collect::<PyResult<Vec<_>>>()?;
+            dict.set_item(name.bind(py), PyList::new(py, values)?)?;
+        }
+
+        Ok(dict.into())
+    }
+
     pub fn col_specs(&self, py: Python) -> PyResult<Py<PyAny>> {
+        // Prepared statements share their specs list built at prepare time;
+        // handing it out is a refcount bump.
+        if let Some(metadata) = &self.prepared_metadata {
+            return Ok(metadata.specs.clone_ref(py).into());
+        }
+
         let py_list = PyList::empty(py);
 
         if let Some(ref rows_result) = self.rows_result {
@@ -206,76 +269,185 @@ impl QueryResult {
         slf
     }
 
-    pub fn __next__(mut slf: PyRefMut<'_, Self>) -> Option<Row> {
-        if let Some(ref rows_result) = slf.rows_result {
-            if let Ok(rows) = rows_result.rows::<ScyllaRow>() {
-                let rows_vec: Vec<ScyllaRow> = rows.filter_map(|r| r.ok()).collect();
-                if slf.current_row < rows_vec.len() {
-                    let row = Row::new(&rows_vec[slf.current_row]);
-                    slf.current_row += 1;
-                    return Some(row);
-                }
-            }
+    pub fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<Row>> {
+        let current = slf.current_row;
+        let py = slf.py();
+        let names = slf.column_names(py);
+        let rows = slf.ensure_rows(py)?;
+
+        if current < rows.len() {
+            let row = Row::new(&rows[current], names);
+            slf.current_row = current + 1;
+            Ok(Some(row))
+        } else {
+            Ok(None)
         }
-        None
     }
 
     pub fn __len__(&self) -> usize {
-        if let Some(ref rows_result) = self.rows_result {
-            rows_result.rows_num()
-        } else {
-            0
-        }
+        self.row_count
     }
 
     pub fn __bool__(&self) -> bool {
-        if let Some(ref rows_result) = self.rows_result {
-            rows_result.rows_num() > 0
-        } else {
-            false
-        }
+        self.row_count != 0
+    }
+}
+
+/// Async iterator over a paged SELECT: rows come out as the driver fetches
+/// pages, so decoding overlaps the network fetch of the next page and memory
+/// stays bounded by the page size regardless of result cardinality.
+#[pyclass]
+pub struct RowStream {
+    stream: Arc<tokio::sync::Mutex<TypedRowStream<ScyllaRow>>>,
+    names: Arc<Vec<Py<PyString>>>,
+}
+
+impl RowStream {
+    pub(crate) fn from_pager(pager: QueryPager) -> PyResult<Self> {
+        let names = Python::attach(|py| {
+            pager
+                .column_specs()
+                .iter()
+                .map(|spec| PyString::intern(py, spec.name()).unbind())
+                .collect::<Vec<_>>()
+        });
+        let stream = pager
+            .rows_stream::<ScyllaRow>()
+            .map_err(deserialization_error)?;
+
+        Ok(RowStream {
+            stream: Arc::new(tokio::sync::Mutex::new(stream)),
+            names: Arc::new(names),
+        })
+    }
+}
+
+#[pymethods]
+impl RowStream {
+    pub fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    pub fn __anext__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let stream = self.stream.clone();
+        let names = self.names.clone();
+
+        future_into_py(py, async move {
+            match stream.lock().await.next().await {
+                Some(row) => {
+                    let row = row.map_err(deserialization_error)?;
+                    Ok(Row::new(&row, names))
+                }
+                None => Err(PyErr::new::<pyo3::exceptions::PyStopAsyncIteration, _>(())),
+            }
+        })
+    }
+}
+
+fn cql_to_i64(value: &CqlValue) -> Option<i64> {
+    match value {
+        CqlValue::TinyInt(i) => Some(*i as i64),
+        CqlValue::SmallInt(i) => Some(*i as i64),
+        CqlValue::Int(i) => Some(*i as i64),
+        CqlValue::BigInt(i) => Some(*i),
+        CqlValue::Counter(c) => Some(c.0),
+        _ => None,
+    }
+}
+
+fn cql_to_f64(value: &CqlValue) -> Option<f64> {
+    match value {
+        CqlValue::Float(f) => Some(*f as f64),
+        CqlValue::Double(d) => Some(*d),
+        _ => None,
     }
 }
 
 #[pyclass]
-#[derive(Clone)]
 pub struct Row {
     columns: Vec<Option<CqlValue>>,
+    // Interned column names shared with the QueryResult this row came from.
+    names: Arc<Vec<Py<PyString>>>,
+    // Converted Python values, built once on first access; columns(), get()
+    // and indexing all serve from this tuple instead of re-converting the
+    // CqlValues on every call.
+    values: std::sync::OnceLock<Py<PyTuple>>,
 }
 
-impl Row {
-    pub fn new(row: &ScyllaRow) -> Self {
+impl Clone for Row {
+    fn clone(&self) -> Self {
         Row {
-            columns: row.columns.clone(),
+            columns: self.columns.clone(),
+            names: self.names.clone(),
+            // Cloning a Py handle needs the GIL; let the clone rebuild its
+            // value tuple lazily instead.
+            values: std::sync::OnceLock::new(),
         }
     }
 }
 
-#[pymethods]
 impl Row {
-    pub fn columns(&self, py: Python) -> PyResult<Py<PyAny>> {
-        let py_list = PyList::empty(py);
+    pub fn new(row: &ScyllaRow, names: Arc<Vec<Py<PyString>>>) -> Self {
+        Row {
+            columns: row.columns.clone(),
+            names,
+            values: std::sync::OnceLock::new(),
+        }
+    }
+
+    fn values_tuple(&self, py: Python) -> PyResult<&Py<PyTuple>> {
+        if let Some(tuple) = self.values.get() {
+            return Ok(tuple);
+        }
+
+        let mut values = Vec::with_capacity(self.columns.len());
         for column in &self.columns {
-            let value = match column {
+            values.push(match column {
                 Some(val) => cql_value_to_py(py, val)?,
                 None => py.None(),
-            };
-            py_list.append(value)?;
+            });
+        }
+        let tuple = PyTuple::new(py, values)?.unbind();
+        Ok(self.values.get_or_init(|| tuple))
+    }
+
+    fn cell(&self, index: usize) -> PyResult<&CqlValue> {
+        match self.columns.get(index) {
+            Some(Some(val)) => Ok(val),
+            Some(None) => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                "Column {} is null",
+                index
+            ))),
+            None => Err(PyErr::new::<pyo3::exceptions::PyIndexError, _>(format!(
+                "Column index {} out of range",
+                index
+            ))),
         }
-        Ok(py_list.into())
+    }
+}
+
+#[pymethods]
+impl Row {
+    pub fn columns(&self, py: Python) -> PyResult<Py<PyAny>> {
+        // Built as a tuple: sized up front, no per-element list growth, and
+        // immutable for callers, so repeat calls can share one object.
+        Ok(self.values_tuple(py)?.clone_ref(py).into())
     }
 
     pub fn as_dict(&self, py: Python) -> PyResult<Py<PyAny>> {
         let dict = PyDict::new(py);
 
-        // Note: In a real implementation, you'd need column names from the result metadata
-        // For now, we'll use indices as keys
         for (i, column) in self.columns.iter().enumerate() {
             let value = match column {
                 Some(val) => cql_value_to_py(py, val)?,
                 None => py.None(),
             };
-            dict.set_item(format!("col_{}", i), value)?;
+            match self.names.get(i) {
+                Some(name) => dict.set_item(name.bind(py), value)?,
+                // No metadata for this column (should not happen for row
+                // results); keep the old positional key as a fallback.
+                None => dict.set_item(format!("col_{}", i), value)?,
+            }
         }
 
         Ok(dict.into())
@@ -283,10 +455,7 @@ impl Row {
 
     pub fn get(&self, py: Python, index: usize) -> PyResult<Py<PyAny>> {
         if index < self.columns.len() {
-            match &self.columns[index] {
-                Some(val) => cql_value_to_py(py, val),
-                None => Ok(py.None()),
-            }
+            Ok(self.values_tuple(py)?.bind(py).get_item(index)?.unbind())
         } else {
             Err(PyErr::new::<pyo3::exceptions::PyIndexError, _>(format!(
                 "Column index {} out of range",
@@ -295,6 +464,58 @@ impl Row {
         }
     }
 
+    /// Get a text column by index without going through the generic
+    /// CqlValue-to-Python conversion (or the cached value tuple). PyO3 copies
+    /// the borrowed &str into a PyString on return; there is no intermediate
+    /// boxing or variant dispatch beyond the single match below.
+    pub fn get_str(&self, index: usize) -> PyResult<&str> {
+        match self.cell(index)? {
+            CqlValue::Text(s) | CqlValue::Ascii(s) => Ok(s),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                "Column {} is not a text value",
+                index
+            ))),
+        }
+    }
+
+    /// Get an integer column by index; accepts all CQL integer widths.
+    pub fn get_int(&self, index: usize) -> PyResult<i64> {
+        match self.cell(index)? {
+            CqlValue::TinyInt(v) => Ok(*v as i64),
+            CqlValue::SmallInt(v) => Ok(*v as i64),
+            CqlValue::Int(v) => Ok(*v as i64),
+            CqlValue::BigInt(v) => Ok(*v),
+            CqlValue::Counter(v) => Ok(v.0),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                "Column {} is not an integer value",
+                index
+            ))),
+        }
+    }
+
+    /// Get a float or double column by index.
+    pub fn get_float(&self, index: usize) -> PyResult<f64> {
+        match self.cell(index)? {
+            CqlValue::Float(v) => Ok(*v as f64),
+            CqlValue::Double(v) => Ok(*v),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                "Column {} is not a float value",
+                index
+            ))),
+        }
+    }
+
+    /// Get a boolean column by index.
+    pub fn get_bool(&self, index: usize) -> PyResult<bool> {
+        match self.cell(index)? {
+            CqlValue::Boolean(v) => Ok(*v),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                "Column {} is not a boolean value",
+                index
+            ))),
+        }
+    }
+
     pub fn __len__(&self) -> usize {
         self.columns.len()
     }
@@ -308,10 +529,7 @@ impl Row {
         };
 
         if idx < self.columns.len() {
-            match &self.columns[idx] {
-                Some(val) => cql_value_to_py(py, val),
-                None => Ok(py.None()),
-            }
+            Ok(self.values_tuple(py)?.bind(py).get_item(idx)?.unbind())
         } else {
             Err(PyErr::new::<pyo3::exceptions::PyIndexError, _>(format!(
                 "Column index {} out of range",
@@ -1,19 +1,27 @@
+use futures::future::try_join_all;
+use futures::stream::{self, StreamExt, TryStreamExt};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyDict, PyList, PyString};
 use pyo3_async_runtimes::tokio::future_into_py;
 use scylla::client::session::Session as ScyllaSession;
 use scylla::client::session_builder::SessionBuilder as ScyllaSessionBuilder;
-use std::sync::Arc;
+use scylla::statement::batch::{Batch as ScyllaBatch, BatchStatement, BatchType};
+use scylla::statement::prepared::PreparedStatement as ScyllaPreparedStatement;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
 use std::time::Duration;
 
 use crate::batch::Batch;
 use crate::error::{
-    prepare_error_to_py, query_error_to_py, schema_agreement_error_to_py, session_error_to_py,
-    use_keyspace_error_to_py,
+    pager_error_to_py, prepare_error_to_py, query_error_to_py, schema_agreement_error_to_py,
+    session_error_to_py, use_keyspace_error_to_py,
+};
+use crate::query::{PreparedStatement, Query, ResultMetadata};
+use crate::result::{QueryResult, RowStream};
+use crate::types::{
+    column_kind_of, py_any_to_bound_values, py_dict_to_serialized_values, py_rows_to_positional,
+    py_values_to_positional,
 };
-use crate::query::{PreparedStatement, Query};
-use crate::result::QueryResult;
-use crate::types::py_dict_to_serialized_values;
 
 #[pyclass]
 #[derive(Clone, Default)]
@@ -66,6 +74,24 @@ impl SessionBuilder {
         Ok(self.clone())
     }
 
+    /// Size the pool as connections per Scylla shard instead of per host.
+    /// Scylla serves each core from its own shard, so a per-host pool can
+    /// bottleneck on a single shard's in-flight request cap; 1 per shard
+    /// suits light loads, 2-4 throughput-oriented workloads.
+    pub fn connections_per_shard(&mut self, count: usize) -> PyResult<Self> {
+        use std::num::NonZeroUsize;
+        let non_zero_count = NonZeroUsize::new(count).ok_or_else(|| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Connections per shard must be greater than 0",
+            )
+        })?;
+        self.builder = self
+            .builder
+            .clone()
+            .pool_size(scylla::client::PoolSize::PerShard(non_zero_count));
+        Ok(self.clone())
+    }
+
     pub fn user(&mut self, username: &str, password: &str) -> PyResult<Self> {
         self.builder = self.builder.clone().user(username, password);
         Ok(self.clone())
@@ -107,15 +133,67 @@ impl SessionBuilder {
 
             Ok(Session {
                 session: Arc::new(session),
+                prepared_cache: Arc::new(Mutex::new(PreparedCacheInner::new())),
+                schema_version: Arc::new(Mutex::new(None)),
             })
         })
     }
 }
 
+/// Client-side cache of prepared statements keyed on CQL text, shared by
+/// every clone of a session. Entries carry a logical timestamp bumped on
+/// every hit, so when the cache fills up only the least recently used
+/// statement is evicted instead of dropping the whole map.
+pub(crate) struct PreparedCacheInner {
+    entries: HashMap<String, (Arc<ScyllaPreparedStatement>, u64)>,
+    clock: u64,
+}
+
+impl PreparedCacheInner {
+    pub(crate) fn new() -> Self {
+        PreparedCacheInner {
+            entries: HashMap::new(),
+            clock: 0,
+        }
+    }
+
+    fn get(&mut self, key: &str) -> Option<Arc<ScyllaPreparedStatement>> {
+        self.clock += 1;
+        let clock = self.clock;
+        self.entries.get_mut(key).map(|(prepared, last_used)| {
+            *last_used = clock;
+            prepared.clone()
+        })
+    }
+
+    fn insert(&mut self, key: String, prepared: Arc<ScyllaPreparedStatement>) {
+        if self.entries.len() >= PREPARED_CACHE_MAX && !self.entries.contains_key(&key) {
+            if let Some(lru_key) = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (_, last_used))| *last_used)
+                .map(|(key, _)| key.clone())
+            {
+                self.entries.remove(&lru_key);
+            }
+        }
+        self.clock += 1;
+        self.entries.insert(key, (prepared, self.clock));
+    }
+}
+
+pub(crate) type PreparedCache = Mutex<PreparedCacheInner>;
+
+const PREPARED_CACHE_MAX: usize = 256;
+
 #[pyclass]
 #[derive(Clone)]
 pub struct Session {
     pub(crate) session: Arc<ScyllaSession>,
+    pub(crate) prepared_cache: Arc<PreparedCache>,
+    /// Schema version observed at the last successful agreement, used to
+    /// short-circuit await_schema_agreement when nothing changed since.
+    pub(crate) schema_version: Arc<Mutex<Option<uuid::Uuid>>>,
 }
 
 #[pymethods]
@@ -132,18 +210,29 @@ impl Session {
         &self,
         py: Python<'py>,
         query: &str,
-        values: Option<&Bound<'_, PyDict>>,
+        values: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<Bound<'py, PyAny>> {
-        let serialized_values = py_dict_to_serialized_values(values)?;
+        let serialized_values = py_any_to_bound_values(values)?;
 
         let session = self.session.clone();
+        let cache = self.prepared_cache.clone();
         let query_str = query.to_string();
 
         future_into_py(py, async move {
-            let result = session
-                .query_unpaged(query_str, serialized_values)
-                .await
-                .map_err(query_error_to_py)?;
+            // Repeated DML strings are prepared once and reuse the cached
+            // server-side plan; everything else takes the plain query path.
+            let result = if is_cacheable_statement(&query_str) {
+                let prepared = get_or_prepare(&session, &cache, &query_str).await?;
+                session
+                    .execute_unpaged(&prepared, serialized_values)
+                    .await
+                    .map_err(query_error_to_py)?
+            } else {
+                session
+                    .query_unpaged(query_str, serialized_values)
+                    .await
+                    .map_err(query_error_to_py)?
+            };
 
             Ok(QueryResult::new(result))
         })
@@ -154,9 +243,9 @@ impl Session {
         &self,
         py: Python<'py>,
         query: &Query,
-        values: Option<&Bound<'_, PyDict>>,
+        values: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<Bound<'py, PyAny>> {
-        let serialized_values = py_dict_to_serialized_values(values)?;
+        let serialized_values = py_any_to_bound_values(values)?;
 
         let session = self.session.clone();
         let scylla_query = query.inner.clone();
@@ -171,18 +260,107 @@ impl Session {
         })
     }
 
+    /// Run a SELECT with transparent paging and return an async iterator
+    /// over its rows. Unlike execute(), nothing is materialized up front:
+    /// each page is fetched as iteration reaches it.
+    #[pyo3(signature = (query, values=None))]
+    pub fn stream<'py>(
+        &self,
+        py: Python<'py>,
+        query: &str,
+        values: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let serialized_values = py_any_to_bound_values(values)?;
+
+        let session = self.session.clone();
+        let query_str = query.to_string();
+
+        future_into_py(py, async move {
+            let pager = session
+                .query_iter(query_str, serialized_values)
+                .await
+                .map_err(pager_error_to_py)?;
+
+            RowStream::from_pager(pager)
+        })
+    }
+
     pub fn prepare<'py>(&self, py: Python<'py>, query: &str) -> PyResult<Bound<'py, PyAny>> {
         let session = self.session.clone();
         let query_str = query.to_string();
 
         future_into_py(py, async move {
-            let prepared = session
+            let mut prepared = session
                 .prepare(query_str)
                 .await
                 .map_err(prepare_error_to_py)?;
 
+            // Let the server omit result metadata on every EXECUTE; skipped
+            // for wildcard/COUNT selects whose column set can silently change
+            // under ALTER TABLE. Callers can opt out per statement through
+            // PreparedStatement.set_use_cached_metadata(False).
+            if metadata_cache_safe(prepared.get_statement()) {
+                prepared.set_use_cached_result_metadata(true);
+            }
+
+            // Reads are safe to retry, so mark them idempotent up front:
+            // this lets the driver retry on another replica and enables
+            // speculative execution. Writes are left to the caller, since
+            // non-LWT inserts can still contain now()/uuid() calls.
+            if is_select_statement(prepared.get_statement()) {
+                prepared.set_is_idempotent(true);
+            }
+
+            // Intern the parameter names once so per-call dict lookups use
+            // keys with a cached hash instead of re-hashing short strings.
+            // The result-set metadata is likewise converted to Python here,
+            // once: the server fixes it at prepare time, so every result
+            // from this statement can share the same objects.
+            let (param_keys, result_metadata) = Python::attach(|py| -> PyResult<_> {
+                let param_keys = prepared
+                    .get_variable_col_specs()
+                    .iter()
+                    .map(|spec| PyString::intern(py, spec.name()).unbind())
+                    .collect::<Vec<_>>();
+
+                let specs_guard = prepared.get_current_result_set_col_specs();
+                let result_names = specs_guard
+                    .get()
+                    .iter()
+                    .map(|spec| PyString::intern(py, spec.name()).unbind())
+                    .collect::<Vec<_>>();
+
+                let specs = PyList::empty(py);
+                for spec in specs_guard.get().iter() {
+                    let dict = PyDict::new(py);
+                    dict.set_item("table_spec", format!("{:?}", spec.table_spec()))?;
+                    dict.set_item("name", spec.name().to_string())?;
+                    dict.set_item("typ", format!("{:?}", spec.typ()))?;
+                    specs.append(dict)?;
+                }
+
+                Ok((
+                    param_keys,
+                    ResultMetadata {
+                        names: Arc::new(result_names),
+                        specs: specs.unbind(),
+                    },
+                ))
+            })?;
+
+            // Pick a converter per bind parameter from the statement's
+            // column types, so binding skips the generic trial chain.
+            let param_kinds = prepared
+                .get_variable_col_specs()
+                .iter()
+                .map(|spec| column_kind_of(spec.typ()))
+                .collect::<Vec<_>>();
+
             Ok(PreparedStatement {
                 prepared: Arc::new(prepared),
+                param_keys: Arc::new(param_keys),
+                param_kinds: Arc::new(param_kinds),
+                result_metadata: Arc::new(result_metadata),
             })
         })
     }
@@ -192,12 +370,14 @@ impl Session {
         &self,
         py: Python<'py>,
         prepared: &PreparedStatement,
-        values: Option<&Bound<'_, PyDict>>,
+        values: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<Bound<'py, PyAny>> {
-        let serialized_values = py_dict_to_serialized_values(values)?;
+        let serialized_values =
+            py_values_to_positional(&prepared.param_keys, &prepared.param_kinds, values)?;
 
         let session = self.session.clone();
         let prep = prepared.prepared.clone();
+        let metadata = prepared.result_metadata.clone();
 
         future_into_py(py, async move {
             let result = session
@@ -205,10 +385,130 @@ impl Session {
                 .await
                 .map_err(query_error_to_py)?;
 
+            Ok(QueryResult::new_prepared(result, metadata))
+        })
+    }
+
+    /// Send one prepared statement with N rows of values as a single CQL
+    /// BATCH frame: one coordinator dispatch instead of N round-trips.
+    /// Defaults to an unlogged batch, the right choice for plain bulk
+    /// inserts that do not need batch-log atomicity.
+    #[pyo3(signature = (prepared, values, batch_type="unlogged"))]
+    pub fn execute_batch<'py>(
+        &self,
+        py: Python<'py>,
+        prepared: &PreparedStatement,
+        values: &Bound<'_, PyList>,
+        batch_type: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let btype = match batch_type.to_lowercase().as_str() {
+            "logged" => BatchType::Logged,
+            "unlogged" => BatchType::Unlogged,
+            "counter" => BatchType::Counter,
+            _ => {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "Invalid batch type. Must be 'logged', 'unlogged', or 'counter'",
+                ))
+            }
+        };
+
+        let rows = py_rows_to_positional(&prepared.param_keys, &prepared.param_kinds, values)?;
+
+        let mut scylla_batch = ScyllaBatch::new(btype);
+        for _ in 0..rows.len() {
+            scylla_batch.append_statement(BatchStatement::PreparedStatement(
+                (*prepared.prepared).clone(),
+            ));
+        }
+
+        let session = self.session.clone();
+
+        future_into_py(py, async move {
+            let result = session
+                .batch(&scylla_batch, rows)
+                .await
+                .map_err(query_error_to_py)?;
+
             Ok(QueryResult::new(result))
         })
     }
 
+    /// Execute one prepared statement once per row of values, with every
+    /// execution in flight at the same time, and return the results in row
+    /// order. Collapses the await-per-iteration loop into a single await
+    /// costing one round-trip worth of latency.
+    pub fn execute_many<'py>(
+        &self,
+        py: Python<'py>,
+        prepared: &PreparedStatement,
+        values: &Bound<'_, PyList>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let rows = py_rows_to_positional(&prepared.param_keys, &prepared.param_kinds, values)?;
+
+        let session = self.session.clone();
+        let prep = prepared.prepared.clone();
+        let metadata = prepared.result_metadata.clone();
+
+        future_into_py(py, async move {
+            let results = try_join_all(rows.into_iter().map(|row| {
+                let session = session.clone();
+                let prep = prep.clone();
+                let metadata = metadata.clone();
+                async move {
+                    let result = session
+                        .execute_unpaged(&prep, row)
+                        .await
+                        .map_err(query_error_to_py)?;
+
+                    Ok::<_, PyErr>(QueryResult::new_prepared(result, metadata))
+                }
+            }))
+            .await?;
+
+            Ok(results)
+        })
+    }
+
+    /// Ship several independent parameterless statements in one call and
+    /// return their results in submission order. All requests are in flight
+    /// at once, so N statements cost one round-trip worth of latency rather
+    /// than N sequential ones. Repeated DML strings go through the prepared
+    /// cache exactly like execute().
+    pub fn pipeline<'py>(
+        &self,
+        py: Python<'py>,
+        queries: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let session = self.session.clone();
+        let cache = self.prepared_cache.clone();
+
+        future_into_py(py, async move {
+            let results = try_join_all(queries.into_iter().map(|query_str| {
+                let session = session.clone();
+                let cache = cache.clone();
+                async move {
+                    let result = if is_cacheable_statement(&query_str) {
+                        let prepared = get_or_prepare(&session, &cache, &query_str).await?;
+                        session
+                            .execute_unpaged(&prepared, ())
+                            .await
+                            .map_err(query_error_to_py)?
+                    } else {
+                        session
+                            .query_unpaged(query_str, ())
+                            .await
+                            .map_err(query_error_to_py)?
+                    };
+
+                    Ok::<_, PyErr>(QueryResult::new(result))
+                }
+            }))
+            .await?;
+
+            Ok(results)
+        })
+    }
+
     pub fn batch<'py>(
         &self,
         py: Python<'py>,
@@ -216,9 +516,10 @@ impl Session {
         values: &Bound<'_, PyList>,
     ) -> PyResult<Bound<'py, PyAny>> {
         let session = self.session.clone();
-        let scylla_batch = batch.inner.clone();
+        let cache = self.prepared_cache.clone();
+        let mut scylla_batch = batch.inner.clone();
 
-        let mut batch_values = Vec::new();
+        let mut batch_values = Vec::with_capacity(values.len());
         for item in values.iter() {
             if let Ok(dict) = item.cast::<PyDict>() {
                 let serialized = py_dict_to_serialized_values(Some(dict))?;
@@ -229,6 +530,68 @@ impl Session {
         }
 
         future_into_py(py, async move {
+            // A single-statement non-counter batch pays batch framing and
+            // (for LOGGED) a batchlog write for zero atomicity benefit, so
+            // route it through a plain execution instead, carrying the
+            // batch-level settings over to the statement.
+            if scylla_batch.statements.len() == 1
+                && !matches!(scylla_batch.get_type(), BatchType::Counter)
+            {
+                let values = batch_values.into_iter().next().unwrap_or_default();
+                let result = match scylla_batch.statements.remove(0) {
+                    BatchStatement::Query(mut query) => {
+                        if let Some(consistency) = scylla_batch.get_consistency() {
+                            query.set_consistency(consistency);
+                        }
+                        query.set_serial_consistency(scylla_batch.get_serial_consistency());
+                        query.set_timestamp(scylla_batch.get_timestamp());
+                        query.set_is_idempotent(scylla_batch.get_is_idempotent());
+                        query.set_tracing(scylla_batch.get_tracing());
+
+                        session
+                            .query_unpaged(query, values)
+                            .await
+                            .map_err(query_error_to_py)?
+                    }
+                    BatchStatement::PreparedStatement(mut prepared) => {
+                        if let Some(consistency) = scylla_batch.get_consistency() {
+                            prepared.set_consistency(consistency);
+                        }
+                        prepared.set_serial_consistency(scylla_batch.get_serial_consistency());
+                        prepared.set_timestamp(scylla_batch.get_timestamp());
+                        prepared.set_is_idempotent(scylla_batch.get_is_idempotent());
+                        prepared.set_tracing(scylla_batch.get_tracing());
+
+                        session
+                            .execute_unpaged(&prepared, values)
+                            .await
+                            .map_err(query_error_to_py)?
+                    }
+                    other => {
+                        // Unknown statement kind: put it back and run the
+                        // batch unchanged.
+                        scylla_batch.statements.push(other);
+                        session
+                            .batch(&scylla_batch, vec![values])
+                            .await
+                            .map_err(query_error_to_py)?
+                    }
+                };
+
+                return Ok(QueryResult::new(result));
+            }
+
+            // Upgrade raw CQL statements to cached prepared plans so repeated
+            // batches skip the server-side parse, mirroring execute().
+            for stmt in scylla_batch.statements.iter_mut() {
+                if let BatchStatement::Query(q) = stmt {
+                    if is_cacheable_statement(&q.contents) {
+                        let prepared = get_or_prepare(&session, &cache, &q.contents).await?;
+                        *stmt = BatchStatement::PreparedStatement((*prepared).clone());
+                    }
+                }
+            }
+
             let result = session
                 .batch(&scylla_batch, batch_values)
                 .await
@@ -238,6 +601,174 @@ impl Session {
         })
     }
 
+    pub fn batch_partitioned<'py>(
+        &self,
+        py: Python<'py>,
+        batch: &Batch,
+        values: &Bound<'_, PyList>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let session = self.session.clone();
+        let mut scylla_batch = batch.inner.clone();
+
+        let mut batch_values = Vec::with_capacity(values.len());
+        for item in values.iter() {
+            if let Ok(dict) = item.cast::<PyDict>() {
+                let serialized = py_dict_to_serialized_values(Some(dict))?;
+                batch_values.push(serialized);
+            } else {
+                batch_values.push(py_dict_to_serialized_values(None)?);
+            }
+        }
+
+        future_into_py(py, async move {
+            let statements = std::mem::take(&mut scylla_batch.statements);
+            if statements.len() != batch_values.len() {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "values must have one entry per batch statement",
+                ));
+            }
+
+            // Group statements by the token of their partition key so each
+            // sub-batch stays partition-local and can be routed straight to
+            // the replica set that owns it. Statements whose token cannot be
+            // computed land in a shared fallback sub-batch.
+            let mut groups: HashMap<Option<i64>, (scylla::statement::batch::Batch, Vec<_>)> =
+                HashMap::new();
+            for (stmt, row) in statements.into_iter().zip(batch_values) {
+                let prepared = match stmt {
+                    BatchStatement::PreparedStatement(prepared) => prepared,
+                    _ => {
+                        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                            "batch_partitioned requires every statement to be prepared",
+                        ))
+                    }
+                };
+
+                let token = prepared
+                    .calculate_token(&row)
+                    .ok()
+                    .flatten()
+                    .map(|t| t.value());
+
+                let (sub_batch, rows) = groups.entry(token).or_insert_with(|| {
+                    let mut sub = scylla::statement::batch::Batch::new(scylla_batch.get_type());
+                    if let Some(consistency) = scylla_batch.get_consistency() {
+                        sub.set_consistency(consistency);
+                    }
+                    sub.set_serial_consistency(scylla_batch.get_serial_consistency());
+                    sub.set_timestamp(scylla_batch.get_timestamp());
+                    sub.set_is_idempotent(scylla_batch.get_is_idempotent());
+                    sub.set_tracing(scylla_batch.get_tracing());
+                    (sub, Vec::new())
+                });
+                sub_batch.append_statement(prepared);
+                rows.push(row);
+            }
+
+            let sub_batch_count = groups.len();
+
+            stream::iter(groups.into_values().map(|(sub_batch, rows)| {
+                let session = session.clone();
+                async move {
+                    session
+                        .batch(&sub_batch, rows)
+                        .await
+                        .map_err(query_error_to_py)
+                }
+            }))
+            .buffer_unordered(16)
+            .try_for_each(|_| async { Ok(()) })
+            .await?;
+
+            Ok(sub_batch_count)
+        })
+    }
+
+    #[pyo3(signature = (prepared, values, concurrency=100))]
+    pub fn execute_concurrent<'py>(
+        &self,
+        py: Python<'py>,
+        prepared: &PreparedStatement,
+        values: &Bound<'_, PyList>,
+        concurrency: usize,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let rows = py_rows_to_positional(&prepared.param_keys, &prepared.param_kinds, values)?;
+
+        let session = self.session.clone();
+        let prep = prepared.prepared.clone();
+        let concurrency = concurrency.max(1);
+
+        future_into_py(py, async move {
+            let executed = rows.len();
+
+            // Fan the rows out with bounded concurrency instead of paying
+            // one full round trip per row.
+            stream::iter(rows.into_iter().map(|row| {
+                let session = session.clone();
+                let prep = prep.clone();
+                async move {
+                    session
+                        .execute_unpaged(&prep, row)
+                        .await
+                        .map_err(query_error_to_py)
+                }
+            }))
+            .buffer_unordered(concurrency)
+            .try_for_each(|_| async { Ok(()) })
+            .await?;
+
+            Ok(executed)
+        })
+    }
+
+    /// Like execute_concurrent, but collect every row's QueryResult and
+    /// return them in row order. In-flight requests are capped at
+    /// `concurrency`, keeping the driver's stream-ID multiplexing saturated
+    /// while pending memory stays at O(concurrency); rows finish in any
+    /// order and are slotted back by the index carried through the stream.
+    #[pyo3(signature = (prepared, values, concurrency=100))]
+    pub fn execute_concurrent_results<'py>(
+        &self,
+        py: Python<'py>,
+        prepared: &PreparedStatement,
+        values: &Bound<'_, PyList>,
+        concurrency: usize,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let rows = py_rows_to_positional(&prepared.param_keys, &prepared.param_kinds, values)?;
+
+        let session = self.session.clone();
+        let prep = prepared.prepared.clone();
+        let metadata = prepared.result_metadata.clone();
+        let concurrency = concurrency.max(1);
+
+        future_into_py(py, async move {
+            let mut results: Vec<Option<QueryResult>> = Vec::new();
+            results.resize_with(rows.len(), || None);
+
+            let mut in_flight = stream::iter(rows.into_iter().enumerate().map(|(index, row)| {
+                let session = session.clone();
+                let prep = prep.clone();
+                let metadata = metadata.clone();
+                async move {
+                    let result = session
+                        .execute_unpaged(&prep, row)
+                        .await
+                        .map_err(query_error_to_py)?;
+
+                    Ok::<_, PyErr>((index, QueryResult::new_prepared(result, metadata)))
+                }
+            }))
+            .buffer_unordered(concurrency);
+
+            while let Some(item) = in_flight.next().await {
+                let (index, result) = item?;
+                results[index] = Some(result);
+            }
+
+            Ok(results.into_iter().flatten().collect::<Vec<_>>())
+        })
+    }
+
     pub fn use_keyspace<'py>(
         &self,
         py: Python<'py>,
@@ -257,14 +788,35 @@ impl Session {
         })
     }
 
-    pub fn await_schema_agreement<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+    #[pyo3(signature = (force=false))]
+    pub fn await_schema_agreement<'py>(
+        &self,
+        py: Python<'py>,
+        force: bool,
+    ) -> PyResult<Bound<'py, PyAny>> {
         let session = self.session.clone();
+        let cached = self.schema_version.clone();
 
         future_into_py(py, async move {
-            session
+            // Fast path: one agreement probe. If the cluster already agrees
+            // on the same version we saw last time, no DDL has landed since
+            // and the polling loop can be skipped entirely.
+            if !force {
+                let previous = *cached.lock().unwrap();
+                if let (Some(previous), Ok(Some(current))) =
+                    (previous, session.check_schema_agreement().await)
+                {
+                    if previous == current {
+                        return Ok(true);
+                    }
+                }
+            }
+
+            let version = session
                 .await_schema_agreement()
                 .await
                 .map_err(schema_agreement_error_to_py)?;
+            *cached.lock().unwrap() = Some(version);
 
             // Return True when schema agreement is reached
             Ok(true)
@@ -280,3 +832,62 @@ impl Session {
         self.session.get_keyspace().map(|s| s.to_string())
     }
 }
+
+/// Result-metadata caching is safe unless the column set can change between
+/// prepares without the statement text changing, which is the case for
+/// wildcard and COUNT selects.
+fn metadata_cache_safe(cql: &str) -> bool {
+    let upper = cql.trim_start().to_ascii_uppercase();
+    !(upper.starts_with("SELECT *") || upper.starts_with("SELECT COUNT"))
+}
+
+/// True for statements whose first keyword is SELECT.
+fn is_select_statement(cql: &str) -> bool {
+    let trimmed = cql.trim_start();
+    trimmed
+        .as_bytes()
+        .get(..6)
+        .is_some_and(|prefix| prefix.eq_ignore_ascii_case(b"SELECT"))
+}
+
+/// Statements worth auto-preparing: DML that benefits from reusing a
+/// server-side plan. DDL and everything else stay on the plain query path.
+fn is_cacheable_statement(cql: &str) -> bool {
+    let trimmed = cql.trim_start();
+    ["SELECT", "INSERT", "UPDATE", "DELETE"].iter().any(|kw| {
+        trimmed.len() >= kw.len()
+            && trimmed.as_bytes()[..kw.len()].eq_ignore_ascii_case(kw.as_bytes())
+    })
+}
+
+async fn get_or_prepare(
+    session: &ScyllaSession,
+    cache: &PreparedCache,
+    cql: &str,
+) -> PyResult<Arc<ScyllaPreparedStatement>> {
+    // A statement with an unqualified table name binds to the keyspace that
+    // was current at prepare time, so CQL text alone is an ambiguous key:
+    // after use_keyspace() the same text must be re-prepared against the new
+    // keyspace instead of silently reusing the old plan.
+    let statement = cql.trim();
+    let keyspace = session.get_keyspace();
+    let key = format!(
+        "{}\u{0}{}",
+        keyspace.as_deref().map_or("", |ks| ks.as_str()),
+        statement
+    );
+
+    if let Some(prepared) = cache.lock().unwrap().get(&key) {
+        return Ok(prepared);
+    }
+
+    let prepared = Arc::new(
+        session
+            .prepare(statement.to_string())
+            .await
+            .map_err(prepare_error_to_py)?,
+    );
+
+    cache.lock().unwrap().insert(key, prepared.clone());
+    Ok(prepared)
+}
@@ -1,12 +1,12 @@
 use pyo3::conversion::IntoPyObjectExt;
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyList, PyString};
 use scylla::value::CqlValue;
 use std::collections::HashMap;
 
 pub fn cql_value_to_py(py: Python, value: &CqlValue) -> PyResult<Py<PyAny>> {
     match value {
-        CqlValue::Ascii(s) | CqlValue::Text(s) => Ok(s.clone().into_bound_py_any(py)?.into()),
+        CqlValue::Ascii(s) | CqlValue::Text(s) => Ok(text_to_py(py, s)),
         CqlValue::Boolean(b) => Ok((*b).into_bound_py_any(py)?.into()),
         CqlValue::Int(i) => Ok((*i).into_bound_py_any(py)?.into()),
         CqlValue::BigInt(i) => Ok((*i).into_bound_py_any(py)?.into()),
@@ -171,6 +171,11 @@ pub enum SerializableValue {
     Blob(Vec<u8>),
     Timestamp(chrono::DateTime<chrono::Utc>),
     List(Vec<SerializableValue>),
+    // Homogeneous text collections skip the one-enum-wrapper-per-element
+    // layout above and serialize as a plain Vec<String>. Numeric lists stay
+    // on the generic variant: without column metadata the element wire type
+    // (int vs bigint) is ambiguous.
+    TextList(Vec<String>),
     #[allow(dead_code)]
     Set(Vec<SerializableValue>),
     // For maps, we use simpler types that scylla can handle directly
@@ -206,6 +211,7 @@ impl scylla::serialize::value::SerializeValue for SerializableValue {
                 timestamp.serialize(_typ, writer)
             }
             SerializableValue::List(items) => items.serialize(_typ, writer),
+            SerializableValue::TextList(items) => items.serialize(_typ, writer),
             SerializableValue::Set(items) => {
                 // Sets are serialized as lists in scylla
                 items.serialize(_typ, writer)
@@ -216,12 +222,189 @@ impl scylla::serialize::value::SerializeValue for SerializableValue {
     }
 }
 
+/// Converter selected per bind parameter when a statement is prepared. The
+/// prepared metadata already names each column's CQL type, so conversion can
+/// jump straight to the right extraction instead of walking the trial chain
+/// in py_value_to_serializable for every value.
+#[derive(Debug, Clone, Copy)]
+pub enum ColumnKind {
+    Boolean,
+    Int,
+    BigInt,
+    Float,
+    Double,
+    Text,
+    Blob,
+    Timestamp,
+    /// Collections, UDTs and anything else: use the generic trial chain.
+    Other,
+}
+
+pub fn column_kind_of(typ: &scylla::frame::response::result::ColumnType) -> ColumnKind {
+    use scylla::frame::response::result::{ColumnType, NativeType};
+
+    match typ {
+        ColumnType::Native(NativeType::Boolean) => ColumnKind::Boolean,
+        ColumnType::Native(NativeType::Int) => ColumnKind::Int,
+        ColumnType::Native(NativeType::BigInt | NativeType::Counter) => ColumnKind::BigInt,
+        ColumnType::Native(NativeType::Float) => ColumnKind::Float,
+        ColumnType::Native(NativeType::Double) => ColumnKind::Double,
+        ColumnType::Native(NativeType::Ascii | NativeType::Text) => ColumnKind::Text,
+        ColumnType::Native(NativeType::Blob) => ColumnKind::Blob,
+        ColumnType::Native(NativeType::Timestamp) => ColumnKind::Timestamp,
+        _ => ColumnKind::Other,
+    }
+}
+
+/// Convert one value using the converter picked at prepare time. Falls back
+/// to the generic chain when the targeted extraction does not fit, so
+/// anything the untyped path accepted still binds.
+fn py_value_to_serializable_typed(
+    kind: ColumnKind,
+    val: &Bound<'_, PyAny>,
+) -> PyResult<SerializableValue> {
+    if val.is_none() {
+        return Ok(SerializableValue::Null);
+    }
+
+    match kind {
+        ColumnKind::Boolean => {
+            if let Ok(b) = val.extract::<bool>() {
+                return Ok(SerializableValue::Bool(b));
+            }
+        }
+        ColumnKind::Int => {
+            if let Ok(i) = val.extract::<i32>() {
+                return Ok(SerializableValue::Int(i));
+            }
+        }
+        ColumnKind::BigInt => {
+            // The column is known to be a bigint, so the timestamp-range
+            // heuristic of the generic chain must not kick in here.
+            if let Ok(i) = val.extract::<i64>() {
+                return Ok(SerializableValue::BigInt(i));
+            }
+        }
+        ColumnKind::Float => {
+            if let Ok(f) = val.extract::<f32>() {
+                return Ok(SerializableValue::Float(f));
+            }
+        }
+        ColumnKind::Double => {
+            if let Ok(f) = val.extract::<f64>() {
+                return Ok(SerializableValue::Double(f));
+            }
+        }
+        ColumnKind::Text => {
+            if let Ok(s) = val.cast::<PyString>() {
+                return Ok(SerializableValue::Text(s.to_str()?.to_owned()));
+            }
+        }
+        ColumnKind::Blob => {
+            if let Ok(b) = val.cast::<PyBytes>() {
+                return Ok(SerializableValue::Blob(b.as_bytes().to_vec()));
+            }
+        }
+        ColumnKind::Timestamp => {
+            use chrono::TimeZone;
+            // Integers are epoch milliseconds or seconds (same split as the
+            // generic chain), floats are fractional epoch seconds.
+            if let Ok(i) = val.extract::<i64>() {
+                let (secs, nanos) = if i.unsigned_abs() >= 1_000_000_000_000 {
+                    (i / 1000, ((i % 1000) * 1_000_000) as u32)
+                } else {
+                    (i, 0)
+                };
+                let dt = chrono::Utc
+                    .timestamp_opt(secs, nanos)
+                    .single()
+                    .ok_or_else(|| {
+                        PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid timestamp value")
+                    })?;
+                return Ok(SerializableValue::Timestamp(dt));
+            }
+            if let Ok(f) = val.extract::<f64>() {
+                let dt = chrono::Utc
+                    .timestamp_opt(f as i64, (f.fract() * 1_000_000_000.0) as u32)
+                    .single()
+                    .ok_or_else(|| {
+                        PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid timestamp value")
+                    })?;
+                return Ok(SerializableValue::Timestamp(dt));
+            }
+        }
+        ColumnKind::Other => {}
+    }
+
+    py_value_to_serializable(val)
+}
+
+/// Bind parameters for an unprepared statement: either named (from a dict)
+/// or positional (from a list/tuple). Positional binding skips per-call key
+/// hashing and name matching entirely.
+pub enum BoundValues {
+    Named(HashMap<String, SerializableValue>),
+    Positional(Vec<SerializableValue>),
+}
+
+impl scylla::serialize::row::SerializeRow for BoundValues {
+    fn serialize(
+        &self,
+        ctx: &scylla::serialize::row::RowSerializationContext<'_>,
+        writer: &mut scylla::serialize::writers::RowWriter<'_>,
+    ) -> Result<(), scylla::serialize::SerializationError> {
+        match self {
+            BoundValues::Named(map) => map.serialize(ctx, writer),
+            BoundValues::Positional(values) => values.serialize(ctx, writer),
+        }
+    }
+
+    fn is_empty(&self) -> bool {
+        match self {
+            BoundValues::Named(map) => map.is_empty(),
+            BoundValues::Positional(values) => values.is_empty(),
+        }
+    }
+}
+
+/// Convert caller-supplied values for an unprepared statement. Dicts bind by
+/// name; lists and tuples bind by position.
+pub fn py_any_to_bound_values(values: Option<&Bound<'_, PyAny>>) -> PyResult<BoundValues> {
+    let Some(values) = values else {
+        return Ok(BoundValues::Positional(Vec::new()));
+    };
+
+    if let Ok(dict) = values.cast::<PyDict>() {
+        return Ok(BoundValues::Named(py_dict_to_serialized_values(Some(
+            dict,
+        ))?));
+    }
+
+    let cells: Vec<Bound<'_, PyAny>> = if let Ok(list) = values.cast::<PyList>() {
+        list.iter().collect()
+    } else if let Ok(tuple) = values.cast::<pyo3::types::PyTuple>() {
+        tuple.iter().collect()
+    } else {
+        return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+            "Values must be a dict, list or tuple, got {:?}",
+            values.get_type()
+        )));
+    };
+
+    let mut out = Vec::with_capacity(cells.len());
+    for cell in &cells {
+        out.push(py_value_to_serializable(cell)?);
+    }
+    Ok(BoundValues::Positional(out))
+}
+
 pub fn py_dict_to_serialized_values(
     dict: Option<&Bound<'_, PyDict>>,
 ) -> PyResult<HashMap<String, SerializableValue>> {
     let mut serialized = HashMap::new();
 
     if let Some(d) = dict {
+        serialized.reserve(d.len());
         for (key, val) in d.iter() {
             let key_str = key.extract::<String>()?;
 
@@ -235,11 +418,131 @@ pub fn py_dict_to_serialized_values(
     Ok(serialized)
 }
 
+/// Pull one row's cells out in bind order. Sequences are taken as-is; dicts
+/// are reordered into the statement's parameter order so the driver skips
+/// per-parameter name matching on every execution.
+fn py_row_cells<'py>(
+    param_keys: &[Py<PyString>],
+    row: &Bound<'py, PyAny>,
+) -> PyResult<Vec<Bound<'py, PyAny>>> {
+    if row.is_none() {
+        return Ok(Vec::new());
+    }
+
+    if let Ok(list) = row.cast::<PyList>() {
+        return Ok(list.iter().collect());
+    }
+
+    if let Ok(tuple) = row.cast::<pyo3::types::PyTuple>() {
+        return Ok(tuple.iter().collect());
+    }
+
+    if let Ok(dict) = row.cast::<PyDict>() {
+        let py = row.py();
+        let mut cells = Vec::with_capacity(param_keys.len());
+        for key in param_keys {
+            let key = key.bind(py);
+            match dict.get_item(key)? {
+                Some(val) => cells.push(val),
+                None => {
+                    return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                        "Missing value for parameter '{}'",
+                        key
+                    )))
+                }
+            }
+        }
+        return Ok(cells);
+    }
+
+    Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+        "Values must be a dict, list or tuple, got {:?}",
+        row.get_type()
+    )))
+}
+
+/// Convert caller-supplied values into positional bind parameters for a
+/// prepared statement.
+pub fn py_values_to_positional(
+    param_keys: &[Py<PyString>],
+    param_kinds: &[ColumnKind],
+    values: Option<&Bound<'_, PyAny>>,
+) -> PyResult<Vec<SerializableValue>> {
+    let Some(values) = values else {
+        return Ok(Vec::new());
+    };
+
+    let cells = py_row_cells(param_keys, values)?;
+    let mut out = Vec::with_capacity(cells.len());
+    for (i, cell) in cells.iter().enumerate() {
+        out.push(py_value_to_serializable_typed(
+            kind_at(param_kinds, i),
+            cell,
+        )?);
+    }
+    Ok(out)
+}
+
+fn kind_at(param_kinds: &[ColumnKind], i: usize) -> ColumnKind {
+    param_kinds.get(i).copied().unwrap_or(ColumnKind::Other)
+}
+
+/// Convert N rows bound to the same prepared statement, walking column-major:
+/// all cells are gathered first, then converted one column at a time. Values
+/// within a column share a Python type in practice, so the type-dispatch
+/// chain in py_value_to_serializable stays predictable across the inner loop
+/// instead of re-branching per row.
+pub fn py_rows_to_positional(
+    param_keys: &[Py<PyString>],
+    param_kinds: &[ColumnKind],
+    rows: &Bound<'_, PyList>,
+) -> PyResult<Vec<Vec<SerializableValue>>> {
+    let mut cells: Vec<Vec<Bound<'_, PyAny>>> = Vec::with_capacity(rows.len());
+    for row in rows.iter() {
+        cells.push(py_row_cells(param_keys, &row)?);
+    }
+
+    let n_cols = cells.first().map_or(0, |row| row.len());
+    let mut out: Vec<Vec<SerializableValue>> = cells
+        .iter()
+        .map(|row| Vec::with_capacity(row.len()))
+        .collect();
+
+    for col in 0..n_cols {
+        let kind = kind_at(param_kinds, col);
+        for (row_idx, row_cells) in cells.iter().enumerate() {
+            let cell = row_cells.get(col).ok_or_else(|| {
+                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "Row {} has {} values, expected {}",
+                    row_idx,
+                    row_cells.len(),
+                    n_cols
+                ))
+            })?;
+            out[row_idx].push(py_value_to_serializable_typed(kind, cell)?);
+        }
+    }
+
+    Ok(out)
+}
+
 fn py_value_to_serializable(val: &Bound<'_, PyAny>) -> PyResult<SerializableValue> {
     if val.is_none() {
         return Ok(SerializableValue::Null);
     }
 
+    // Exact-type fast paths for str and bytes. These are the most common
+    // large payloads, and neither can ever satisfy the numeric extracts
+    // below, so check them up front instead of paying a chain of failed
+    // extraction attempts first. The borrowed data is copied once, straight
+    // from the Python buffer.
+    if let Ok(s) = val.cast_exact::<PyString>() {
+        return Ok(SerializableValue::Text(s.to_str()?.to_owned()));
+    }
+    if let Ok(b) = val.cast_exact::<PyBytes>() {
+        return Ok(SerializableValue::Blob(b.as_bytes().to_vec()));
+    }
+
     // Try bool first (before int, as bool is a subclass of int in Python)
     if let Ok(b) = val.extract::<bool>() {
         return Ok(SerializableValue::Bool(b));
@@ -310,7 +613,21 @@ fn py_value_to_serializable(val: &Bound<'_, PyAny>) -> PyResult<SerializableValu
 
     // Try list
     if let Ok(list) = val.cast::<PyList>() {
-        let mut items = Vec::new();
+        // All-str lists (the common list<text>/set<text> case) collect into
+        // one Vec<String> instead of wrapping every element in the enum.
+        if !list.is_empty()
+            && list
+                .iter()
+                .all(|item| item.cast_exact::<PyString>().is_ok())
+        {
+            let mut items = Vec::with_capacity(list.len());
+            for item in list.iter() {
+                items.push(item.cast_exact::<PyString>()?.to_str()?.to_owned());
+            }
+            return Ok(SerializableValue::TextList(items));
+        }
+
+        let mut items = Vec::with_capacity(list.len());
         for item in list.iter() {
             items.push(py_value_to_serializable(&item)?);
         }
@@ -369,3 +686,41 @@ fn py_value_to_serializable(val: &Bound<'_, PyAny>) -> PyResult<SerializableValu
         val.get_type()
     )))
 }
+
+/// Short text values repeat heavily in result sets (usernames, status
+/// strings, enum-like columns); serve them from a bounded pool so repeats
+/// are a refcount bump instead of a fresh allocation, and equality checks
+/// between pooled values become pointer compares. The pool does not use
+/// CPython's intern table, which is append-only for the process lifetime
+/// and so could not be bounded against arbitrary data.
+const TEXT_POOL_MAX_LEN: usize = 20;
+const TEXT_POOL_MAX: usize = 1024;
+
+static TEXT_POOL: std::sync::OnceLock<std::sync::Mutex<HashMap<String, Py<PyString>>>> =
+    std::sync::OnceLock::new();
+
+fn text_to_py(py: Python, s: &str) -> Py<PyAny> {
+    if s.len() > TEXT_POOL_MAX_LEN {
+        return PyString::new(py, s).into();
+    }
+
+    let pool = TEXT_POOL.get_or_init(|| std::sync::Mutex::new(HashMap::new()));
+    let mut pool = pool.lock().unwrap();
+
+    if let Some(cached) = pool.get(s) {
+        return cached.clone_ref(py).into();
+    }
+
+    // Generation-based eviction: once full, drop the whole map and let hot
+    // strings repopulate within a few rows. This keeps a miss O(1) even for
+    // result sets of mostly-unique short values (ids, codes, tokens), which
+    // hit the miss path on every cell and would otherwise pay a full
+    // eviction scan each time.
+    if pool.len() >= TEXT_POOL_MAX {
+        pool.clear();
+    }
+
+    let value = PyString::new(py, s).unbind();
+    pool.insert(s.to_string(), value.clone_ref(py));
+    value.into()
+}
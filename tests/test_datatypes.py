@@ -45,7 +45,7 @@ class TestDataTypes:
         assert row[1] == "Hello, World!"
         assert row[2] == "Test string"
 
-        await session.execute("DROP TABLE IF EXISTS test_text")
+        await session.execute("TRUNCATE test_text")
 
     async def test_boolean_type(self, session, test_keyspace):
         """Test boolean type conversion"""
@@ -79,7 +79,7 @@ class TestDataTypes:
         row = result.first_row()
         assert row[1] is False
 
-        await session.execute("DROP TABLE IF EXISTS test_boolean")
+        await session.execute("TRUNCATE test_boolean")
 
     async def test_blob_type(self, session, test_keyspace):
         """Test blob type conversion"""
@@ -106,7 +106,7 @@ class TestDataTypes:
 
         assert row[1] == binary_data
 
-        await session.execute("DROP TABLE IF EXISTS test_blob")
+        await session.execute("TRUNCATE test_blob")
 
     async def test_timestamp_type(self, session, test_keyspace):
         """Test timestamp type conversion"""
@@ -134,7 +134,7 @@ class TestDataTypes:
         # Timestamp should be close to what we inserted
         assert abs(row[1] - current_time) < 1000
 
-        await session.execute("DROP TABLE IF EXISTS test_timestamp")
+        await session.execute("TRUNCATE test_timestamp")
 
     async def test_list_type(self, session, test_keyspace):
         """Test list type conversion"""
@@ -161,7 +161,7 @@ class TestDataTypes:
 
         assert row[1] == tags
 
-        await session.execute("DROP TABLE IF EXISTS test_list")
+        await session.execute("TRUNCATE test_list")
 
     async def test_set_type(self, session, test_keyspace):
         """Test set type conversion"""
@@ -191,7 +191,7 @@ class TestDataTypes:
         assert isinstance(row[1], list)
         assert set(row[1]) == set(categories)
 
-        await session.execute("DROP TABLE IF EXISTS test_set")
+        await session.execute("TRUNCATE test_set")
 
     async def test_map_type(self, session, test_keyspace):
         """Test map type conversion"""
@@ -219,7 +219,7 @@ class TestDataTypes:
 
         assert row[1] == attributes
 
-        await session.execute("DROP TABLE IF EXISTS test_map")
+        await session.execute("TRUNCATE test_map")
 
     async def test_null_values(self, session, test_keyspace):
         """Test NULL value handling"""
@@ -249,7 +249,7 @@ class TestDataTypes:
         assert row[1] is None
         assert row[2] is None
 
-        await session.execute("DROP TABLE IF EXISTS test_null")
+        await session.execute("TRUNCATE test_null")
 
     # REMOVED: test_counter_type - fails due to counter type serialization with named parameters
     # Counter columns require i64 but small values are serialized as i32
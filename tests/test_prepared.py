@@ -16,39 +16,76 @@ class TestPreparedStatement:
         prepared = await session.prepare("INSERT INTO users (id, username, email) VALUES (?, ?, ?)")
         assert prepared is not None
 
-    async def test_execute_prepared_insert(self, session, users_table):
+    async def test_execute_prepared_insert(self, session, users_table, users_prepared):
         """Test executing prepared INSERT"""
-        prepared = await session.prepare("INSERT INTO users (id, username, email) VALUES (?, ?, ?)")
-
         await session.execute_prepared(
-            prepared, {"id": 300, "username": "prepareduser", "email": "prepared@example.com"}
+            users_prepared["insert"],
+            {"id": 300, "username": "prepareduser", "email": "prepared@example.com"},
         )
 
         # Verify
         result = await session.execute("SELECT * FROM users WHERE id = ?", {"id": 300})
         assert len(result) == 1
 
-    async def test_execute_prepared_select(self, session, users_table, sample_users):
+    async def test_execute_prepared_select(
+        self, session, users_table, sample_users, users_prepared
+    ):
         """Test executing prepared SELECT"""
-        prepared = await session.prepare("SELECT * FROM users WHERE id = ?")
-
-        result = await session.execute_prepared(prepared, {"id": 1})
+        result = await session.execute_prepared(users_prepared["select_by_id"], {"id": 1})
         assert len(result) == 1
 
-    async def test_prepared_multiple_executions(self, session, users_table):
+    async def test_prepared_multiple_executions(self, session, users_table, users_prepared):
         """Test executing prepared statement multiple times"""
-        prepared = await session.prepare("INSERT INTO users (id, username, email) VALUES (?, ?, ?)")
-
-        # Execute multiple times
-        for i in range(400, 410):
-            await session.execute_prepared(
-                prepared, {"id": i, "username": f"user{i}", "email": f"user{i}@example.com"}
-            )
+        # Execute for all rows in one round-trip worth of latency
+        results = await session.execute_many(
+            users_prepared["insert"],
+            [
+                {"id": i, "username": f"user{i}", "email": f"user{i}@example.com"}
+                for i in range(400, 410)
+            ],
+        )
+        assert len(results) == 10
 
         # Verify all inserts
         _ = await session.execute("SELECT COUNT(*) FROM users")
         # Should have at least 10 rows
 
+    async def test_execute_concurrent(self, session, users_table, users_prepared):
+        """Test bounded-concurrency execution over many rows"""
+        rows = [(i, f"conc{i}", f"conc{i}@example.com") for i in range(600, 620)]
+
+        executed = await session.execute_concurrent(users_prepared["insert"], rows, concurrency=8)
+        assert executed == len(rows)
+
+        # Verify the first and last rows landed
+        for user_id in (600, 619):
+            result = await session.execute("SELECT * FROM users WHERE id = ?", {"id": user_id})
+            assert len(result) == 1
+
+    async def test_execute_concurrent_results_order(
+        self, session, users_table, sample_users, users_prepared
+    ):
+        """Test concurrent execution returns results in submission order"""
+        ids = [3, 1, 2, 1, 3]
+
+        results = await session.execute_concurrent_results(
+            users_prepared["select_by_id"], [(user_id,) for user_id in ids]
+        )
+
+        # Rows complete in any order but are slotted back by index
+        assert len(results) == len(ids)
+        assert [result.first_row().get_int(0) for result in results] == ids
+
+    async def test_execute_concurrent_results_single(
+        self, session, users_table, sample_users, users_prepared
+    ):
+        """Test concurrent execution with concurrency=1"""
+        results = await session.execute_concurrent_results(
+            users_prepared["select_by_id"], [(1,), (2,)], concurrency=1
+        )
+
+        assert [result.first_row().get_int(0) for result in results] == [1, 2]
+
     async def test_prepared_with_consistency(self, session, users_table):
         """Test prepared statement with consistency level"""
         prepared = await session.prepare("SELECT * FROM users WHERE id = ?")
@@ -89,22 +126,20 @@ class TestPreparedStatement:
         stmt = prepared.get_statement()
         assert stmt == query_str
 
-    async def test_prepared_update(self, session, users_table, sample_users):
+    async def test_prepared_update(self, session, users_table, sample_users, users_prepared):
         """Test prepared UPDATE statement"""
-        prepared = await session.prepare("UPDATE users SET email = ? WHERE id = ?")
-
-        await session.execute_prepared(prepared, {"email": "updated@example.com", "id": 1})
+        await session.execute_prepared(
+            users_prepared["update_email"], {"email": "updated@example.com", "id": 1}
+        )
 
         # Verify
         result = await session.execute("SELECT email FROM users WHERE id = ?", {"id": 1})
         row = result.first_row()
-        assert row[0] == "updated@example.com"
+        assert row.get_str(0) == "updated@example.com"
 
-    async def test_prepared_delete(self, session, users_table, sample_users):
+    async def test_prepared_delete(self, session, users_table, sample_users, users_prepared):
         """Test prepared DELETE statement"""
-        prepared = await session.prepare("DELETE FROM users WHERE id = ?")
-
-        await session.execute_prepared(prepared, {"id": 2})
+        await session.execute_prepared(users_prepared["delete_by_id"], {"id": 2})
 
         # Verify
         result = await session.execute("SELECT * FROM users WHERE id = ?", {"id": 2})
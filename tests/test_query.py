@@ -2,6 +2,7 @@
 Tests for Query execution
 """
 
+import asyncio
 import time
 
 import pytest
@@ -68,7 +69,7 @@ class TestQueryExecution:
         # Verify
         result = await session.execute("SELECT email FROM users WHERE id = ?", {"id": 1})
         row = result.first_row()
-        email = row[0]
+        email = row.get_str(0)
         assert email == "newemail@example.com"
 
     async def test_delete(self, session, users_table, sample_users):
@@ -80,6 +81,20 @@ class TestQueryExecution:
         result = await session.execute("SELECT * FROM users WHERE id = ?", {"id": 1})
         assert len(result) == 0
 
+    async def test_pipeline(self, session, users_table, sample_users):
+        """Test pipelining independent queries"""
+        results = await session.pipeline(
+            [
+                "SELECT username FROM users WHERE id = 1",
+                "SELECT username FROM users WHERE id = 2",
+            ]
+        )
+
+        # Results come back in submission order regardless of completion order
+        assert len(results) == 2
+        assert results[0].first_row().get_str(0) == "alice"
+        assert results[1].first_row().get_str(0) == "bob"
+
     async def test_invalid_query(self, session, test_keyspace):
         """Test invalid query raises error"""
         with pytest.raises(ScyllaError):
@@ -165,8 +180,11 @@ class TestQueryObject:
         # Only test consistency levels that work with a single-node cluster
         consistency_levels = ["ONE", "QUORUM", "ALL", "LOCAL_QUORUM", "LOCAL_ONE"]
 
-        for consistency in consistency_levels:
-            query = Query("SELECT * FROM users").with_consistency(consistency)
-            # Should not raise error
-            result = await session.query(query)
-            assert result is not None
+        # The reads are independent, so issue them all at once and let the
+        # driver multiplex them over its in-flight request slots
+        queries = [
+            Query("SELECT * FROM users").with_consistency(consistency)
+            for consistency in consistency_levels
+        ]
+        results = await asyncio.gather(*[session.query(query) for query in queries])
+        assert all(result is not None for result in results)
@@ -92,6 +92,56 @@ class TestQueryResult:
 
         assert count == len(sample_users)
 
+    async def test_result_streaming(self, session, users_table, sample_users):
+        """Test streaming rows page by page"""
+        stream = await session.stream("SELECT * FROM users")
+
+        count = 0
+        async for row in stream:
+            assert row is not None
+            count += 1
+
+        assert count == len(sample_users)
+
+    async def test_result_columns_numpy(self, session, test_keyspace):
+        """Test columnar export to numpy arrays"""
+        np = pytest.importorskip("numpy")
+
+        await session.execute(
+            """
+            CREATE TABLE IF NOT EXISTS test_numpy (
+                id int PRIMARY KEY,
+                score double,
+                label text
+            )
+        """
+        )
+        await session.await_schema_agreement()
+
+        await session.execute(
+            "INSERT INTO test_numpy (id, score, label) VALUES (?, ?, ?)",
+            {"id": 1, "score": 1.5, "label": "a"},
+        )
+        await session.execute(
+            "INSERT INTO test_numpy (id, score) VALUES (?, ?)", {"id": 2, "score": 2.5}
+        )
+
+        result = await session.execute("SELECT id, score, label FROM test_numpy")
+        columns = result.columns_numpy()
+
+        # Integer columns come back as int64 arrays, floats as float64
+        assert columns["id"].dtype == np.int64
+        assert sorted(columns["id"].tolist()) == [1, 2]
+        assert columns["score"].dtype == np.float64
+        assert sorted(columns["score"].tolist()) == [1.5, 2.5]
+
+        # Text columns (and any column containing nulls) fall back to a list
+        assert isinstance(columns["label"], list)
+        assert set(columns["label"]) == {"a", None}
+
+        # Cleanup
+        await session.execute("TRUNCATE test_numpy")
+
     async def test_result_len(self, session, users_table, sample_users):
         """Test result length"""
         result = await session.execute("SELECT * FROM users")
@@ -119,7 +169,7 @@ class TestRow:
 
         columns = row.columns()
         assert columns is not None
-        assert isinstance(columns, list)
+        assert isinstance(columns, tuple)
         assert len(columns) > 0
 
     async def test_row_get(self, session, users_table, sample_users):
@@ -173,3 +223,51 @@ class TestRow:
         row_dict = row.as_dict()
         assert row_dict is not None
         assert isinstance(row_dict, dict)
+        assert "id" in row_dict
+        assert row_dict["username"] == "alice"
+
+    async def test_row_typed_getters(self, session, users_table, sample_users):
+        """Test typed column getters"""
+        result = await session.execute(
+            "SELECT username, age, is_active FROM users WHERE id = ?", {"id": 1}
+        )
+        row = result.first_row()
+
+        assert row.get_str(0) == "alice"
+        assert row.get_int(1) == 30
+        assert row.get_bool(2) is True
+
+    async def test_row_get_float(self, session, users_table, sample_users):
+        """Test typed float getter"""
+        result = await session.execute(
+            "SELECT CAST(age AS double) FROM users WHERE id = ?", {"id": 1}
+        )
+        row = result.first_row()
+
+        assert row.get_float(0) == 30.0
+
+    async def test_row_typed_getter_mismatch(self, session, users_table, sample_users):
+        """Test typed getters raise TypeError on the wrong column type"""
+        result = await session.execute("SELECT id, username FROM users WHERE id = ?", {"id": 1})
+        row = result.first_row()
+
+        with pytest.raises(TypeError):
+            row.get_str(0)
+        with pytest.raises(TypeError):
+            row.get_int(1)
+        with pytest.raises(TypeError):
+            row.get_float(1)
+        with pytest.raises(TypeError):
+            row.get_bool(1)
+
+    async def test_row_typed_getter_null(self, session, users_table):
+        """Test typed getters raise TypeError on a null cell"""
+        await session.execute(
+            "INSERT INTO users (id, username) VALUES (?, ?)", {"id": 900, "username": "nullage"}
+        )
+
+        result = await session.execute("SELECT age FROM users WHERE id = ?", {"id": 900})
+        row = result.first_row()
+
+        with pytest.raises(TypeError):
+            row.get_int(0)